@@ -1,44 +1,56 @@
 from __future__ import annotations
 
+import functools
+from dataclasses import asdict, dataclass
 
+
+@dataclass(frozen=True, slots=True, repr=False)
 class Material:
-    def __init__(self, name: str, E: float, yield_strength: float, density: float = 1000.0):
-        """Erstellt ein Material mit den wichtigsten Kennwerten.
+    """Material mit den wichtigsten Kennwerten.
 
-        Parameters
-        ----------
-        name : str
-            Name des Materials.
-        E : float
-            E-Modul in GPa.
-        yield_strength : float
-            Streckgrenze in MPa.
-        density : float
-            Dichte in kg/m³.
-        """
-        assert E > 0, "E-Modul muss positiv sein."
-        assert yield_strength > 0, "Streckgrenze muss positiv sein."
-        assert density > 0, "Dichte muss positiv sein."
-        
-        self.name = name
-        self.E = E
-        self.yield_strength = yield_strength
-        self.density = density
+    Unveränderlich (frozen), damit Instanzen gefahrlos zwischen Strukturen
+    geteilt und als Schlüssel verwendet werden können.
+
+    Parameters
+    ----------
+    name : str
+        Name des Materials.
+    E : float
+        E-Modul in GPa.
+    yield_strength : float
+        Streckgrenze in MPa.
+    density : float
+        Dichte in kg/m³.
+    """
+
+    name: str
+    E: float
+    yield_strength: float
+    density: float = 1000.0
+
+    def __post_init__(self):
+        assert self.E > 0, "E-Modul muss positiv sein."
+        assert self.yield_strength > 0, "Streckgrenze muss positiv sein."
+        assert self.density > 0, "Dichte muss positiv sein."
 
     @classmethod
-    def defaults(cls) -> list[Material]:
+    @functools.lru_cache(maxsize=1)
+    def defaults(cls) -> tuple[Material, ...]:
         """Gibt die Standardmaterialien zurück.
 
+        Die Instanzen werden nur einmal erzeugt; Tupel und Materialien sind
+        unveränderlich und dürfen daher geteilt werden.
+
         Returns
         -------
-        list[Material]
+        tuple[Material, ...]
             Stahl, Aluminium, Holz (Fichte).
         """
-        return [
+        return (
             cls("Stahl", E=210.0, yield_strength=250.0, density=7850.0),
             cls("Aluminium", E=70.0, yield_strength=270.0, density=2700.0),
             cls("Holz (Fichte)", E=12.0, yield_strength=40.0, density=500.0),
-        ]
+        )
 
     def to_dict(self) -> dict:
         """Wandelt das Material in ein Dictionary um für JSON-Serialisierung.
@@ -48,12 +60,7 @@ class Material:
         dict
             Dictionary mit allen Materialwerten.
         """
-        return {
-            "name": self.name,
-            "E": self.E,
-            "yield_strength": self.yield_strength,
-            "density": self.density,
-        }
+        return asdict(self)
 
     @classmethod
     def from_dict(cls, d: dict) -> Material:
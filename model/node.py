@@ -2,10 +2,104 @@ import numpy as np
 import numpy.typing as npt
 
 
+class _NodeStore:
+    """Eigener SoA-Speicher für einzelne Knoten ohne Structure (Länge 1)."""
+
+    def __init__(self, n: int = 1):
+        self.node_x = np.zeros(n)
+        self.node_y = np.zeros(n)
+        self.node_active = np.ones(n, dtype=bool)
+        self.fix_x = np.zeros(n, dtype=np.int8)
+        self.fix_y = np.zeros(n, dtype=np.int8)
+        self.force_x = np.zeros(n)
+        self.force_y = np.zeros(n)
+        self.u_x = np.zeros(n)
+        self.u_y = np.zeros(n)
+        self._n_active_nodes = n
+        self._free_dofs = None
+        self._removable = None
+        self._element_matrices = None
+        self._spring_axes = None
+
+
+class _ArrayField:
+    """Attribut eines Knotens, das in ein Array des SoA-Speichers zeigt.
+
+    Mit ``counter`` wird zusätzlich ein Zähler der True-Einträge auf dem
+    Speicher mitgeführt (z.B. Anzahl aktiver Knoten). ``invalidates`` nennt
+    die Caches auf dem Speicher, die beim Schreiben verworfen werden.
+    """
+
+    def __init__(self, array_name: str, cast: type, counter: str | None = None,
+                 invalidates: tuple[str, ...] = ()):
+        self.array_name = array_name
+        self.cast = cast
+        self.counter = counter
+        self.invalidates = invalidates
+
+    def __get__(self, node, owner=None):
+        if node is None:
+            return self
+        return self.cast(getattr(node._store, self.array_name)[node._i])
+
+    def __set__(self, node, value) -> None:
+        arr = getattr(node._store, self.array_name)
+        if self.counter is not None:
+            value = bool(value)
+            if value != arr[node._i]:
+                delta = 1 if value else -1
+                setattr(node._store, self.counter, getattr(node._store, self.counter) + delta)
+        arr[node._i] = value
+        for cache in self.invalidates:
+            setattr(node._store, cache, None)
+
+
+class _CoordField(_ArrayField):
+    """Koordinate eines Knotens; Schreiben verwirft die gecachte Position
+    sowie Elementmatrizen und Federachsen des Speichers. Ein Speicher mit
+    Federn (Structure) bestimmt zudem die Orientierung der Federn am
+    Knoten neu."""
+
+    def __set__(self, node, value) -> None:
+        super().__set__(node, value)
+        node._pos = None
+        store = node._store
+        store._element_matrices = None
+        store._spring_axes = None
+        reclassify = getattr(store, "_reclassify_springs", None)
+        if reclassify is not None:
+            reclassify(node._i)
+
+
 class Node:
-    def __init__(self, node_id: int, x: float, y: float):
+    __slots__ = ("id", "_store", "_i", "_pos")
+
+    x = _CoordField("node_x", float)
+    y = _CoordField("node_y", float)
+
+    # Binäre variable der Topologieoptimierung
+    active = _ArrayField("node_active", bool, counter="_n_active_nodes",
+                         invalidates=("_free_dofs",))
+
+    # Lager-Randbedingungen (kinematische Lagerungen)
+    fix_x = _ArrayField("fix_x", int, invalidates=("_free_dofs", "_removable"))
+    fix_y = _ArrayField("fix_y", int, invalidates=("_free_dofs", "_removable"))
+
+    # Kraft-Randbedingungen (äußere Knotenlastvektoren)
+    force_x = _ArrayField("force_x", float, invalidates=("_removable",))
+    force_y = _ArrayField("force_y", float, invalidates=("_removable",))
+
+    # Primäre Lösungsgrößen des FEM-Gleichungssystems (K·u = F)
+    u_x = _ArrayField("u_x", float)
+    u_y = _ArrayField("u_y", float)
+
+    def __init__(self, node_id: int, x: float, y: float, store=None):
         """Erstellt einen Knoten mit Position und ID.
 
+        Die Knotendaten liegen nicht im Objekt selbst, sondern in den
+        parallelen Arrays eines Speichers (Structure-of-Arrays). Der
+        Knoten ist nur eine Sicht auf den Eintrag ``node_id``.
+
         Parameters
         ----------
         node_id : int
@@ -14,30 +108,51 @@ class Node:
             x-Position im Gitter.
         y : float
             y-Position im Gitter.
+        store : Structure | None, optional
+            Speicher mit den Knoten-Arrays. Wenn None, erhält der Knoten
+            einen eigenen Speicher der Länge 1.
         """
         self.id = node_id
+        if store is None:
+            self._store = _NodeStore()
+            self._i = 0
+        else:
+            self._store = store
+            self._i = node_id
+
         self.x = x
         self.y = y
-        
-        # Binäre variable der Topologieoptimierung 
         self.active = True
-
-        # Lager-Randbedingungen (kinematische Lagerungen)
         self.fix_x = 0
         self.fix_y = 0
-
-        # Kraft-Randbedingungen (äußere Knotenlastvektoren)
         self.force_x = 0.0
         self.force_y = 0.0
-
-        # Primäre Lösungsgrößen des FEM-Gleichungssystems (K·u = F)
         self.u_x = 0.0
         self.u_y = 0.0
 
+    @classmethod
+    def _view(cls, store, node_id: int) -> "Node":
+        """Erzeugt eine Sicht auf einen bereits befüllten Eintrag von store.
+
+        Im Gegensatz zum Konstruktor werden die Arrays nicht beschrieben.
+        """
+        node = cls.__new__(cls)
+        node.id = node_id
+        node._store = store
+        node._i = node_id
+        node._pos = None
+        return node
+
     @property
     def pos(self) -> npt.NDArray[np.float64]:
-        # Vektorielle Basis für die Berechnung der lokalen Elementrichtungsvektoren
-        return np.array([self.x, self.y])
+        # Vektorielle Basis für die Berechnung der lokalen Elementrichtungsvektoren.
+        # Wird beim ersten Zugriff angelegt und danach per Referenz zurückgegeben
+        # (schreibgeschützt); Setzen von x oder y verwirft den Cache.
+        if self._pos is None:
+            pos = np.array([self.x, self.y])
+            pos.flags.writeable = False
+            self._pos = pos
+        return self._pos
 
     def __str__(self) -> str:
         return (f"Node(id={self.id}, pos=({self.x:.0f},{self.y:.0f}), "
@@ -55,4 +170,4 @@ if __name__ == "__main__":
     n.force_y = -1.0
     print(f"{n}")
     n.active = False
-    print(f"{n}")
\ No newline at end of file
+    print(f"{n}")
@@ -1,11 +1,130 @@
+import math
+from collections.abc import Sequence
+
 import numpy as np
 import numpy.typing as npt
 
+# Steifigkeit der Diagonalfedern im Gitter
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
+# Orientierungen der Gitterfedern (Slot-Reihenfolge in Structure.generate_grid)
+ORIENT_OTHER = -1
+ORIENT_H = 0
+ORIENT_V = 1
+ORIENT_DIAG = 2       # (x, y) -> (x+1, y+1)
+ORIENT_ANTIDIAG = 3   # (x+1, y) -> (x, y+1)
+
+
+# Referenz-Elementmatrizen kron([[1,-1],[-1,1]], outer(e_n, e_n)) für k = 1,
+# indiziert mit ORIENT_*. Jede Gitterfeder ist k-mal eine dieser Matrizen.
+_KO_REF = np.array([
+    [[1.0, 0.0, -1.0, 0.0],
+     [0.0, 0.0, 0.0, 0.0],
+     [-1.0, 0.0, 1.0, 0.0],
+     [0.0, 0.0, 0.0, 0.0]],
+    [[0.0, 0.0, 0.0, 0.0],
+     [0.0, 1.0, 0.0, -1.0],
+     [0.0, 0.0, 0.0, 0.0],
+     [0.0, -1.0, 0.0, 1.0]],
+    0.5 * np.array([[1.0, 1.0, -1.0, -1.0],
+                    [1.0, 1.0, -1.0, -1.0],
+                    [-1.0, -1.0, 1.0, 1.0],
+                    [-1.0, -1.0, 1.0, 1.0]]),
+    0.5 * np.array([[1.0, -1.0, -1.0, 1.0],
+                    [-1.0, 1.0, 1.0, -1.0],
+                    [-1.0, 1.0, 1.0, -1.0],
+                    [1.0, -1.0, -1.0, 1.0]]),
+])
+_KO_REF.flags.writeable = False
+
+
+def orientation_of(dx: float, dy: float) -> int:
+    """Klassifiziert einen Federvektor im ganzzahligen Gitter.
+
+    Parameters
+    ----------
+    dx, dy : float
+        Vektor von node_a nach node_b.
+
+    Returns
+    -------
+    int
+        Eine der ORIENT_*-Konstanten.
+    """
+    if dy == 0 and dx != 0:
+        return ORIENT_H
+    if dx == 0 and dy != 0:
+        return ORIENT_V
+    if dx != 0 and dx == dy:
+        return ORIENT_DIAG
+    if dx != 0 and dx == -dy:
+        return ORIENT_ANTIDIAG
+    return ORIENT_OTHER
+
+
+def resolve_stiffness(
+    k: npt.NDArray[np.float64],
+    orientation: npt.NDArray[np.int8],
+) -> npt.NDArray[np.float64]:
+    """Ersetzt automatische Steifigkeiten (NaN) wie in Spring.get_stiffness.
+
+    Parameters
+    ----------
+    k : npt.NDArray[np.float64]
+        Steifigkeiten, NaN = automatisch aus der Orientierung.
+    orientation : npt.NDArray[np.int8]
+        Orientierungen (ORIENT_*) der Federn.
+
+    Returns
+    -------
+    npt.NDArray[np.float64]
+        Neues Array: 1/sqrt(2) für Diagonalen, 1.0 sonst, gesetzte k unverändert.
+    """
+    k = np.array(k, dtype=np.float64)
+    auto = np.isnan(k)
+    k[auto] = np.where(orientation[auto] >= ORIENT_DIAG, _INV_SQRT2, 1.0)
+    return k
+
+
+class _SpringStore:
+    """Eigener SoA-Speicher für einzelne Federn ohne Structure (Länge 1)."""
+
+    def __init__(self, n: int = 1):
+        self.spring_k = np.full(n, np.nan)
+        self.spring_active = np.ones(n, dtype=bool)
+        self._n_active_springs = n
+        self._element_matrices = None
+        self._spring_stiffness = None
+        self._active_springs = None
+        self._node_degree = None
+
 
 class Spring:
-    def __init__(self, spring_id, node_a, node_b, k: float | None = None):
+    """Sicht auf einen Eintrag der Feder-Arrays eines Speichers.
+
+    Die Feder hält nur ihre ID, die Endknoten und den Speicher. Geometrie und
+    Elementmatrix einer Feder in einer Structure kommen aus deren
+    zwischengespeicherten Arrays (spring_axes, element_matrices), statt
+    in jedem Objekt eigene Kopien zu halten.
+    """
+
+    __slots__ = ("id", "node_a", "node_b", "_store", "_i")
+
+    def __init__(
+        self,
+        spring_id,
+        node_a,
+        node_b,
+        k: float | None = None,
+        store=None,
+        orientation: int | None = None,
+    ):
         """Erstellt eine Feder zwischen zwei Knoten.
 
+        Steifigkeit und Aktivität liegen in den parallelen Arrays eines
+        Speichers (Structure-of-Arrays), die Feder ist nur eine Sicht
+        auf den Eintrag ``spring_id``.
+
         Parameters
         ----------
         spring_id : int
@@ -17,14 +136,94 @@ class Spring:
         k : float | None, optional
             Steifigkeit. Wenn None, wird sie automatisch bestimmt:
             1.0 für horizontal/vertikal, 1/sqrt(2) für diagonal.
+        store : Structure | None, optional
+            Speicher mit den Feder-Arrays. Wenn None, erhält die Feder
+            einen eigenen Speicher der Länge 1.
+        orientation : int | None, optional
+            Orientierung (ORIENT_*) für eine Feder in einem Speicher. Wenn
+            None, wird sie aus der Geometrie bestimmt. Eigenständige Federn
+            bestimmen sie stets aus der aktuellen Lage ihrer Knoten.
         """
         self.id = spring_id
         self.node_a = node_a
         self.node_b = node_b
+        if store is None:
+            self._store = _SpringStore()
+            self._i = 0
+        else:
+            self._store = store
+            self._i = spring_id
+
+        if not self._standalone:
+            if orientation is None:
+                orientation = orientation_of(node_b.x - node_a.x, node_b.y - node_a.y)
+            self._store.spring_orientation[self._i] = orientation
+
         self.k = k
-        
         self.active = True
 
+    @classmethod
+    def _view(cls, store, spring_id: int, node_a, node_b) -> "Spring":
+        """Erzeugt eine Sicht auf einen bereits befüllten Eintrag von store.
+
+        Im Gegensatz zum Konstruktor werden die Arrays nicht beschrieben.
+        """
+        spring = cls.__new__(cls)
+        spring.id = spring_id
+        spring.node_a = node_a
+        spring.node_b = node_b
+        spring._store = store
+        spring._i = spring_id
+        return spring
+
+    @property
+    def _standalone(self) -> bool:
+        """True für Federn mit eigenem Speicher (ohne Structure-Caches)."""
+        return isinstance(self._store, _SpringStore)
+
+    @property
+    def k(self) -> float | None:
+        # NaN im Array steht für automatische Bestimmung aus der Geometrie
+        k = self._store.spring_k[self._i]
+        return None if np.isnan(k) else float(k)
+
+    @k.setter
+    def k(self, value: float | None) -> None:
+        self._store.spring_k[self._i] = np.nan if value is None else value
+        self._store._element_matrices = None
+        self._store._spring_stiffness = None
+
+    @property
+    def orientation(self) -> int:
+        """Orientierung der Feder (ORIENT_*) in der aktuellen Geometrie.
+
+        In einer Structure wird sie beim Verschieben eines Endknotens
+        neu bestimmt; eigenständige Federn kennen ihre Knotenspeicher nicht
+        und klassifizieren bei jedem Zugriff.
+        """
+        if self._standalone:
+            return orientation_of(self.node_b.x - self.node_a.x,
+                                  self.node_b.y - self.node_a.y)
+        return int(self._store.spring_orientation[self._i])
+
+    @property
+    def active(self) -> bool:
+        return bool(self._store.spring_active[self._i])
+
+    @active.setter
+    def active(self, value: bool) -> None:
+        # Zähler der aktiven Federn im Speicher mitführen
+        value = bool(value)
+        store = self._store
+        if value != store.spring_active[self._i]:
+            step = 1 if value else -1
+            store._n_active_springs += step
+            store._active_springs = None
+            if store._node_degree is not None:
+                store._node_degree[self.node_a.id] += step
+                store._node_degree[self.node_b.id] += step
+        store.spring_active[self._i] = value
+
     def get_length(self) -> float:
         """Gibt die Länge der Feder zurück.
 
@@ -33,7 +232,9 @@ class Spring:
         float
             Abstand zwischen den beiden Knoten.
         """
-        return np.linalg.norm(self.node_a.pos - self.node_b.pos)
+        if self._standalone:
+            return math.hypot(self.node_b.x - self.node_a.x, self.node_b.y - self.node_a.y)
+        return float(self._store.spring_axes()[1][self._i])
 
     def get_direction_vector(self) -> npt.NDArray[np.float64]:
         """Gibt den normierten Richtungsvektor von node_a nach node_b zurück.
@@ -41,13 +242,20 @@ class Spring:
         Returns
         -------
         npt.NDArray[np.float64]
-            Einheitsvektor [ex, ey].
+            Einheitsvektor [ex, ey] (schreibgeschützt).
         """
-        length = self.get_length()
-        assert length > 1e-9, f"Spring {self.id} has zero length (degenerate element)."
-
-        e_n = (self.node_b.pos - self.node_a.pos) / length
-        return e_n
+        if self._standalone:
+            dx = self.node_b.x - self.node_a.x
+            dy = self.node_b.y - self.node_a.y
+            length = math.hypot(dx, dy)
+            assert length > 1e-9, f"Spring {self.id} has zero length (degenerate element)."
+            e_n = np.array([dx / length, dy / length])
+            e_n.flags.writeable = False
+            return e_n
+
+        e, l0 = self._store.spring_axes()
+        assert l0[self._i] > 1e-9, f"Spring {self.id} has zero length (degenerate element)."
+        return e[self._i]
 
     def get_stiffness(self) -> float:
         """Gibt die Steifigkeit zurück, bestimmt aus der Orientierung.
@@ -60,17 +268,10 @@ class Spring:
         if self.k is not None:
             return self.k
 
-        # Auto-detect aus geometrie
-        dx = self.node_b.x - self.node_a.x
-        dy = self.node_b.y - self.node_a.y
-
-        angle_deg = abs(np.degrees(np.arctan2(dy, dx)))
-
         # Geometrische Steifigkeitskorrektur für Diagonalelemente im normalen Grid
-        if abs(angle_deg - 45) < 5 or abs(angle_deg - 135) < 5:
-            return 1.0 / np.sqrt(2.0)
-        else:
-            return 1.0
+        if self.orientation in (ORIENT_DIAG, ORIENT_ANTIDIAG):
+            return _INV_SQRT2
+        return 1.0
 
     def get_stiffness_matrix(self) -> npt.NDArray[np.float64]:
         """Berechnet die 4x4 Element-Steifigkeitsmatrix in globalen Koordinaten.
@@ -78,21 +279,35 @@ class Spring:
         Returns
         -------
         npt.NDArray[np.float64]
-            4x4 Matrix, Reihenfolge [ax, ay, bx, by].
+            4x4 Matrix, Reihenfolge [ax, ay, bx, by] (schreibgeschützt).
         """
-        k = self.get_stiffness()
-        e_n = self.get_direction_vector()
-
-        # Lokale 1D-Elementsteifigkeitsmatrix
-        K = k * np.array([[1.0, -1.0],
-                          [-1.0, 1.0]])
-
-        # Rotationsmatrix-Äquivalent für die Projektion auf globale Freiheitsgrade
-        O = np.outer(e_n, e_n)
-
-        # Transformation ins globale 2D-Koordinatensystem mit Kronecker-Produkt
-        Ko = np.kron(K, O)
+        if not self._standalone:
+            return self._store.element_matrices()[self._i]
 
+        k = self.get_stiffness()
+        if self.orientation != ORIENT_OTHER:
+            # Gitterfeder: skalierte Referenzmatrix ihrer Orientierung
+            Ko = k * _KO_REF[self.orientation]
+            Ko.flags.writeable = False
+            return Ko
+
+        ex, ey = self.get_direction_vector()
+
+        # Lokale 1D-Elementsteifigkeit k·[[1,-1],[-1,1]] projiziert auf die globalen
+        # Freiheitsgrade: entspricht kron(K, outer(e_n, e_n)), direkt ausgeschrieben.
+        # Skalare Python-Arithmetik und ein einziger Array-Aufbau statt Slice-Zuweisungen.
+        ex, ey = float(ex), float(ey)
+        kxx = k * ex * ex
+        kxy = k * ex * ey
+        kyy = k * ey * ey
+        Ko = np.array([
+            [ kxx,  kxy, -kxx, -kxy],
+            [ kxy,  kyy, -kxy, -kyy],
+            [-kxx, -kxy,  kxx,  kxy],
+            [-kxy, -kyy,  kxy,  kyy],
+        ])
+
+        Ko.flags.writeable = False
         return Ko
 
     def __str__(self) -> str:
@@ -105,6 +320,105 @@ class Spring:
         return self.__str__()
 
 
+def assemble_all_stiffness_matrices(springs: Sequence[Spring]) -> npt.NDArray[np.float64]:
+    """Berechnet die 4x4 Element-Steifigkeitsmatrizen aller Federn in einem Durchgang.
+
+    Vektorisierte Variante von Spring.get_stiffness_matrix: Knotenkoordinaten
+    und Steifigkeiten werden in (N,)-Arrays gesammelt und alle N Matrizen
+    ohne np.outer/np.kron direkt komponentenweise aufgebaut.
+
+    Parameters
+    ----------
+    springs : Sequence[Spring]
+        Die Federn, für die die Matrizen berechnet werden.
+
+    Returns
+    -------
+    npt.NDArray[np.float64]
+        Tensor der Form (N, 4, 4), Reihenfolge [ax, ay, bx, by].
+    """
+    n = len(springs)
+    ax = np.fromiter((s.node_a.x for s in springs), dtype=np.float64, count=n)
+    ay = np.fromiter((s.node_a.y for s in springs), dtype=np.float64, count=n)
+    bx = np.fromiter((s.node_b.x for s in springs), dtype=np.float64, count=n)
+    by = np.fromiter((s.node_b.y for s in springs), dtype=np.float64, count=n)
+    k = np.fromiter((np.nan if s.k is None else s.k for s in springs), dtype=np.float64, count=n)
+    orientation = np.fromiter((s.orientation for s in springs), dtype=np.int8, count=n)
+    return stiffness_matrices(ax, ay, bx, by, k, orientation=orientation)
+
+
+def stiffness_matrices(
+    ax: npt.NDArray[np.float64],
+    ay: npt.NDArray[np.float64],
+    bx: npt.NDArray[np.float64],
+    by: npt.NDArray[np.float64],
+    k: npt.NDArray[np.float64],
+    out: npt.NDArray[np.float64] | None = None,
+    orientation: npt.NDArray[np.int8] | None = None,
+) -> npt.NDArray[np.float64]:
+    """Berechnet die Element-Steifigkeitsmatrizen direkt aus SoA-Arrays.
+
+    Die Komponenten werden mit In-place-Operationen direkt in den
+    Ergebnistensor geschrieben, es entstehen nur (N,)-Zwischenarrays.
+
+    Parameters
+    ----------
+    ax, ay, bx, by : npt.NDArray[np.float64]
+        Koordinaten von Start- und Endknoten, je Form (N,).
+    k : npt.NDArray[np.float64]
+        Steifigkeiten, Form (N,). NaN = automatisch aus der Orientierung.
+    out : npt.NDArray[np.float64] | None, optional
+        Vorhandener Puffer der Form (N, 4, 4), der überschrieben wird.
+    orientation : npt.NDArray[np.int8] | None, optional
+        Vorab bestimmte Orientierungen (ORIENT_*). Sind alle bekannt, werden
+        die Referenzmatrizen skaliert statt aus der Geometrie gerechnet.
+        Wenn None, werden Diagonalen für die Auto-Steifigkeit aus dx, dy erkannt.
+
+    Returns
+    -------
+    npt.NDArray[np.float64]
+        Tensor der Form (N, 4, 4), Reihenfolge [ax, ay, bx, by].
+    """
+    n = k.shape[0]
+    Ko = np.empty((n, 4, 4)) if out is None else out
+    assert Ko.shape == (n, 4, 4), f"Puffer hat Form {Ko.shape}, erwartet {(n, 4, 4)}."
+
+    if orientation is not None and np.all(orientation != ORIENT_OTHER):
+        # Reine Gitterfedern: k-fache Referenzmatrix, keine Geometrie nötig
+        k = resolve_stiffness(k, orientation)
+        return np.multiply(_KO_REF[orientation], k[:, None, None], out=Ko)
+
+    k = np.array(k, dtype=np.float64)
+    dx = np.subtract(bx, ax)
+    dy = np.subtract(by, ay)
+
+    # Auto-Steifigkeit wie in get_stiffness: 1/sqrt(2) für Diagonalen, sonst 1.0
+    auto = np.isnan(k)
+    if np.any(auto):
+        if orientation is not None:
+            diagonal = orientation[auto] >= ORIENT_DIAG
+        else:
+            diagonal = (dx[auto] != 0) & (np.abs(dx[auto]) == np.abs(dy[auto]))
+        k[auto] = np.where(diagonal, _INV_SQRT2, 1.0)
+
+    length = np.hypot(dx, dy)
+    assert np.all(length > 1e-9), "Feder mit Länge 0 (degeneriertes Element)."
+
+    # dx, dy werden zu Einheitsvektoren, k·ex bzw. k·ey landen in length
+    ex = np.divide(dx, length, out=dx)
+    ey = np.divide(dy, length, out=dy)
+    k_ex = np.multiply(k, ex, out=length)
+    np.multiply(k_ex, ex, out=Ko[:, 0, 0])
+    np.multiply(k_ex, ey, out=Ko[:, 0, 1])
+    Ko[:, 1, 0] = Ko[:, 0, 1]
+    np.multiply(np.multiply(k, ey, out=k), ey, out=Ko[:, 1, 1])
+
+    # Blockstruktur von kron([[1,-1],[-1,1]], O): ±k·O in den vier 2x2-Blöcken
+    np.negative(Ko[:, 0:2, 0:2], out=Ko[:, 0:2, 2:4])
+    Ko[:, 2:4, 0:2] = Ko[:, 0:2, 2:4]
+    Ko[:, 2:4, 2:4] = Ko[:, 0:2, 0:2]
+    return Ko
+
 if __name__ == "__main__":
     from node import Node
 
@@ -1,12 +1,154 @@
+import functools
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
 from .node import Node
-from .spring import Spring
+from .spring import Spring, ORIENT_OTHER, orientation_of, resolve_stiffness, stiffness_matrices
 from .material import Material
 
 
+@dataclass(frozen=True, slots=True)
+class _GridTemplate:
+    """Topologie-Arrays eines Gitters fester Größe (schreibgeschützt)."""
+
+    node_x: npt.NDArray[np.float64]
+    node_y: npt.NDArray[np.float64]
+    spring_a: npt.NDArray[np.int32]
+    spring_b: npt.NDArray[np.int32]
+    spring_orientation: npt.NDArray[np.int8]
+    node_spring_indices: npt.NDArray[np.int32]
+    node_spring_offsets: npt.NDArray[np.int64]
+    node_mirror: npt.NDArray[np.int32]
+    stiffness_pattern: tuple[npt.NDArray[np.int32], npt.NDArray[np.int32], npt.NDArray[np.int32]]
+
+
+@functools.lru_cache(maxsize=16)
+def _grid_template(w: int, h: int) -> _GridTemplate:
+    """Baut Koordinaten, Federn und CSR-Adjazenz eines w x h Gitters.
+
+    Das Ergebnis wird je Größe zwischengespeichert; Structure kopiert die
+    Arrays, da Koordinaten und Federn einer Struktur veränderbar sind. Nur
+    das Besetzungsmuster von K und die Spiegeltabelle werden geteilt, sie
+    sind ohnehin schreibgeschützt.
+    """
+    xs, ys = np.meshgrid(np.arange(w, dtype=np.float64),
+                         np.arange(h, dtype=np.float64), indexing="xy")
+
+    # Federn hinzufügen: pro Knoten bis zu 4 Slots (horizontal, vertikal,
+    # Diagonale \, Diagonale /). Die Reihenfolge der Slots in Zeilen-Ordnung
+    # bestimmt die Feder-IDs, damit gespeicherte Strukturen kompatibel bleiben.
+    nid = np.arange(w * h, dtype=np.int32).reshape(h, w)
+    slot_a = np.zeros((h, w, 4), dtype=np.int32)
+    slot_b = np.zeros((h, w, 4), dtype=np.int32)
+    valid = np.zeros((h, w, 4), dtype=bool)
+
+    slot_a[:, :-1, 0], slot_b[:, :-1, 0] = nid[:, :-1], nid[:, 1:]
+    valid[:, :-1, 0] = True
+    slot_a[:-1, :, 1], slot_b[:-1, :, 1] = nid[:-1, :], nid[1:, :]
+    valid[:-1, :, 1] = True
+    slot_a[:-1, :-1, 2], slot_b[:-1, :-1, 2] = nid[:-1, :-1], nid[1:, 1:]
+    valid[:-1, :-1, 2] = True
+    slot_a[:-1, :-1, 3], slot_b[:-1, :-1, 3] = nid[:-1, 1:], nid[1:, :-1]
+    valid[:-1, :-1, 3] = True
+    n_springs = Structure._spring_count(w, h)
+    assert np.count_nonzero(valid) == n_springs
+
+    spring_a = slot_a[valid]
+    spring_b = slot_b[valid]
+    # Orientierung = Slot-Index (ORIENT_H, ORIENT_V, ORIENT_DIAG, ORIENT_ANTIDIAG)
+    orientation = np.broadcast_to(np.arange(4, dtype=np.int8), valid.shape)[valid]
+
+    # CSR-Adjazenz Knoten -> inzidente Feder-IDs für Entfernen in O(Grad):
+    # die Federn von Knoten n liegen in indices[offsets[n]:offsets[n + 1]]
+    ends = np.concatenate([spring_a, spring_b])
+    order = np.argsort(ends, kind="stable")
+    offsets = np.zeros(w * h + 1, dtype=np.int64)
+    np.cumsum(np.bincount(ends, minlength=w * h), out=offsets[1:])
+
+    tpl = _GridTemplate(
+        node_x=xs.ravel(),
+        node_y=ys.ravel(),
+        spring_a=spring_a,
+        spring_b=spring_b,
+        spring_orientation=orientation,
+        node_spring_indices=(order % n_springs).astype(np.int32),
+        node_spring_offsets=offsets,
+        # Spiegelknoten an der vertikalen Mittelachse (x -> w - 1 - x)
+        node_mirror=np.ascontiguousarray(nid[:, ::-1]).ravel(),
+        stiffness_pattern=_build_stiffness_pattern(spring_a, spring_b, w * h),
+    )
+    for arr in (tpl.node_x, tpl.node_y, tpl.spring_a, tpl.spring_b, tpl.spring_orientation,
+                tpl.node_spring_indices, tpl.node_spring_offsets, tpl.node_mirror):
+        arr.flags.writeable = False
+    return tpl
+
+
+def _build_stiffness_pattern(
+    spring_a: npt.NDArray[np.int32],
+    spring_b: npt.NDArray[np.int32],
+    n_nodes: int,
+) -> tuple[npt.NDArray[np.int32], npt.NDArray[np.int32], npt.NDArray[np.int32]]:
+    """CSR-Besetzungsmuster (indptr, indices, slot) zu den Federendpunkten."""
+    n_dof = 2 * n_nodes
+    a, b = spring_a.astype(np.int64), spring_b.astype(np.int64)
+    dofs = np.stack([2 * a, 2 * a + 1, 2 * b, 2 * b + 1], axis=1)
+    rows = np.broadcast_to(dofs[:, :, None], (len(a), 4, 4)).reshape(len(a), 16)
+    cols = np.broadcast_to(dofs[:, None, :], (len(a), 4, 4)).reshape(len(a), 16)
+
+    keys, slot = np.unique(rows * n_dof + cols, return_inverse=True)
+    indptr = np.zeros(n_dof + 1, dtype=np.int32)
+    np.cumsum(np.bincount(keys // n_dof, minlength=n_dof), out=indptr[1:])
+    indices = (keys % n_dof).astype(np.int32)
+    slot = slot.reshape(len(a), 16).astype(np.int32)
+    for arr in (indptr, indices, slot):
+        arr.flags.writeable = False
+    return indptr, indices, slot
+
+
+class _SpringList(Sequence):
+    """Federn der Struktur als Sichten auf die SoA-Arrays.
+
+    Die Spring-Objekte werden erst beim ersten Zugriff erzeugt und dann
+    wiederverwendet; die FEM-Rechnung arbeitet direkt auf den Arrays und
+    braucht sie nicht.
+    """
+
+    def __init__(self, structure: "Structure"):
+        self._structure = structure
+        self._items: list[Spring | None] = [None] * len(structure.spring_a)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        spring = self._items[index]
+        if spring is None:
+            s = self._structure
+            index = range(len(self))[index]
+            a = int(s.spring_a[index])
+            b = int(s.spring_b[index])
+            spring = Spring._view(s, index, s.nodes[a], s.nodes[b])
+            self._items[index] = spring
+        return spring
+
+    def __iter__(self) -> Iterator[Spring]:
+        for i in range(len(self)):
+            yield self[i]
+
+
 class Structure:
     def __init__(self, width: int, height: int, material: Material | None = None):
         """Erstellt die basis Gitterstruktur mit Knoten und Federn.
 
+        Die Knoten- und Federdaten liegen als parallele NumPy-Arrays
+        (Structure-of-Arrays) auf der Struktur; die Objekte in
+        ``nodes`` und ``springs`` sind Sichten auf diese Arrays.
+
         Parameters
         ----------
         width : int
@@ -22,66 +164,446 @@ class Structure:
         self.height = height
         self.material: Material = material if material is not None else Material.defaults()[0]
         self.nodes: list[Node] = []
-        self.springs: list[Spring] = []
+        self.springs: Sequence[Spring] = []
         self.generate_grid()
 
     def _node_id(self, x: int, y: int) -> int:
         """Berechnet die Knoten-ID aus der Gitterposition (x, y) für eindeutige Zuordnung"""
         return y * self.width + x
 
+    def _allocate_arrays(self, n_nodes: int, n_springs: int) -> None:
+        """Legt die SoA-Arrays für Knoten und Federn an."""
+        # Koordinaten und Konnektivität werden von generate_grid vollständig überschrieben
+        self.node_x = np.empty(n_nodes)
+        self.node_y = np.empty(n_nodes)
+        self.node_active = np.ones(n_nodes, dtype=bool)
+        self.fix_x = np.zeros(n_nodes, dtype=np.int8)
+        self.fix_y = np.zeros(n_nodes, dtype=np.int8)
+        self.force_x = np.zeros(n_nodes)
+        self.force_y = np.zeros(n_nodes)
+        self.u_x = np.zeros(n_nodes)
+        self.u_y = np.zeros(n_nodes)
+
+        self.spring_a = np.empty(n_springs, dtype=np.int32)
+        self.spring_b = np.empty(n_springs, dtype=np.int32)
+        self.spring_k = np.full(n_springs, np.nan)
+        self.spring_active = np.ones(n_springs, dtype=bool)
+        self.spring_orientation = np.full(n_springs, ORIENT_OTHER, dtype=np.int8)
+
+        # Laufende Zähler, gepflegt von remove_node und den active-Settern der Sichten
+        self._n_active_nodes = n_nodes
+        self._n_active_springs = n_springs
+        # Indizes der aktiven Federn, verworfen bei jeder Änderung von spring_active
+        self._active_springs: npt.NDArray[np.intp] | None = None
+        self._node_degree: npt.NDArray[np.int64] | None = None
+
+        # Cache der freien DOFs, verworfen von remove_node und den fix/active-Settern
+        self._free_dofs: npt.NDArray[np.intp] | None = None
+        # Cache der Knoten ohne Lager und Last, verworfen von den fix/force-Settern
+        self._removable: npt.NDArray[np.bool_] | None = None
+        # Caches der Elementgrößen, verworfen von den k- bzw. Koordinaten-Settern
+        self._element_matrices: npt.NDArray[np.float64] | None = None
+        self._spring_stiffness: npt.NDArray[np.float64] | None = None
+        self._spring_axes: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]] | None = None
+        # Besetzungsmuster von K, hängt nur von der Gittertopologie ab
+        self._stiffness_pattern: tuple[npt.NDArray[np.int32], ...] | None = None
+
+    # Beim Pickeln nicht mitgeschickt: Sichten und Vorlagen-Arrays werden
+    # neu aufgebaut, Caches bei Bedarf neu berechnet
+    _VIEWS = ("nodes", "springs", "node_mirror", "_stiffness_pattern")
+    _CACHES = ("_free_dofs", "_removable", "_element_matrices", "_spring_stiffness",
+               "_spring_axes", "_active_springs")
+
+    def __getstate__(self) -> dict:
+        """Zustand zum Pickeln: nur die SoA-Arrays, die CSR-Adjazenz und die Zähler.
+
+        Sichten und Caches werden nach dem Laden neu aufgebaut bzw. bei
+        Bedarf neu berechnet; das hält Kopien für Worker-Prozesse klein.
+        """
+        skip = self._VIEWS + self._CACHES
+        return {k: v for k, v in self.__dict__.items() if k not in skip}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        for name in self._CACHES:
+            setattr(self, name, None)
+        # Topologie und Spiegeltabelle sind die der Gittervorlage
+        tpl = _grid_template(self.width, self.height)
+        self._stiffness_pattern = tpl.stiffness_pattern
+        self.node_mirror = tpl.node_mirror
+        self.nodes = [Node._view(self, nid) for nid in range(len(self.node_x))]
+        self.springs = _SpringList(self)
+
+    def arrays(self) -> dict[str, npt.NDArray]:
+        """Gibt die SoA-Arrays der Struktur zurück (keine Kopien).
+
+        Returns
+        -------
+        dict[str, npt.NDArray]
+            Knoten-Arrays der Form (n_nodes,) und Feder-Arrays der Form (n_springs,).
+        """
+        return {
+            "node_x": self.node_x,
+            "node_y": self.node_y,
+            "node_active": self.node_active,
+            "fix_x": self.fix_x,
+            "fix_y": self.fix_y,
+            "force_x": self.force_x,
+            "force_y": self.force_y,
+            "u_x": self.u_x,
+            "u_y": self.u_y,
+            "spring_a": self.spring_a,
+            "spring_b": self.spring_b,
+            "spring_k": self.spring_k,
+            "spring_active": self.spring_active,
+            "spring_orientation": self.spring_orientation,
+        }
+
+    @staticmethod
+    def _spring_count(width: int, height: int) -> int:
+        """Exakte Federanzahl des Gitters: horizontal + vertikal + 2 Diagonalen pro Zelle."""
+        return (width - 1) * height + (height - 1) * width + 2 * (width - 1) * (height - 1)
+
     def generate_grid(self) -> None:
-        for y in range(self.height):
-            for x in range(self.width):
-                nid = self._node_id(x, y)
-                self.nodes.append(Node(nid, float(x), float(y)))
-
-        # Federn hinzufügen
-        spring_id = 0
-        for y in range(self.height):
-            for x in range(self.width):
-                nid = self._node_id(x, y)
-
-                if x < self.width - 1:
-                    self.springs.append(Spring(spring_id, self.nodes[nid], self.nodes[self._node_id(x + 1, y)]))
-                    spring_id += 1
-
-                if y < self.height - 1:
-                    self.springs.append(Spring(spring_id, self.nodes[nid], self.nodes[self._node_id(x, y + 1)]))
-                    spring_id += 1
-
-                if x < self.width - 1 and y < self.height - 1:
-                    self.springs.append(Spring(spring_id, self.nodes[nid], self.nodes[self._node_id(x + 1, y + 1)]))
-                    spring_id += 1
-
-                if x < self.width - 1 and y < self.height - 1:
-                    self.springs.append(Spring(spring_id, self.nodes[self._node_id(x + 1, y)], self.nodes[self._node_id(x, y + 1)]))
-                    spring_id += 1
-
-    def remove_node(self, node_id: int) -> None:
+        w, h = self.width, self.height
+        tpl = _grid_template(w, h)
+        self._allocate_arrays(w * h, len(tpl.spring_a))
+
+        # Gittertopologie aus der Vorlage kopieren, damit Strukturen gleicher
+        # Größe sie nicht jedes Mal neu aufbauen
+        self.node_x[:] = tpl.node_x
+        self.node_y[:] = tpl.node_y
+        self.spring_a[:] = tpl.spring_a
+        self.spring_b[:] = tpl.spring_b
+        self.spring_orientation[:] = tpl.spring_orientation
+        self.node_spring_indices = tpl.node_spring_indices.copy()
+        self.node_spring_offsets = tpl.node_spring_offsets.copy()
+        self._stiffness_pattern = tpl.stiffness_pattern
+        # Knoten-ID des linkssymmetrischen Spiegelknotens (schreibgeschützt)
+        self.node_mirror = tpl.node_mirror
+
+        self.nodes = [Node._view(self, nid) for nid in range(w * h)]
+        self.springs = _SpringList(self)
+
+        # Grad je Knoten (aktive Federn), laufend gepflegt wie die Zähler
+        self._node_degree = np.diff(self.node_spring_offsets)
+
+    def remove_node(self, node_id: int) -> npt.NDArray[np.int32]:
         """Deaktiviert einen Knoten und alle seine Federn.
 
         Parameters
         ----------
         node_id : int
             ID des Knotens der entfernt werden soll.
+
+        Returns
+        -------
+        npt.NDArray[np.int32]
+            IDs der dabei deaktivierten (zuvor aktiven) Federn.
         """
         assert 0 <= node_id < len(self.nodes), f"Ungültige Knoten-ID: {node_id}"
         node = self.nodes[node_id]
         assert node.active, f"Knoten {node_id} ist bereits entfernt."
 
         # Nur logische Deaktivierung, um FEM-Matrixdimensionen konstant zu halten
-        node.active = False
-        for spring in self.springs:
-            if spring.node_a.id == node_id or spring.node_b.id == node_id:
-                spring.active = False
+        self.node_active[node_id] = False
+        self._n_active_nodes -= 1
+        self._free_dofs = None
+
+        incident = self.incident_springs(node_id)
+        live = incident[self.spring_active[incident]]
+        self.spring_active[live] = False
+        self._n_active_springs -= len(live)
+        self._active_springs = None
+        self._node_degree[node_id] -= len(live)
+        np.subtract.at(self._node_degree, self._other_ends(node_id, live), 1)
+        return live
+
+    def restore_node(
+        self,
+        node_id: int,
+        springs: npt.NDArray[np.int32] | None = None,
+    ) -> None:
+        """Macht remove_node rückgängig.
+
+        Der Knoten wird wieder aktiv, ebenso alle Federn zu aktiven Nachbarn.
+
+        Parameters
+        ----------
+        node_id : int
+            ID des wiederherzustellenden Knotens.
+        springs : npt.NDArray[np.int32] | None, optional
+            Nur diese Federn reaktivieren, z.B. die Rückgabe von remove_node
+            für ein exaktes Rückgängigmachen.
+        """
+        assert 0 <= node_id < len(self.nodes), f"Ungültige Knoten-ID: {node_id}"
+        if not self.node_active[node_id]:
+            self.node_active[node_id] = True
+            self._n_active_nodes += 1
+            self._free_dofs = None
+
+        incident = self.incident_springs(node_id) if springs is None else springs
+        other = self._other_ends(node_id, incident)
+        revive = incident[self.node_active[other] & ~self.spring_active[incident]]
+        self.spring_active[revive] = True
+        self._n_active_springs += len(revive)
+        self._active_springs = None
+        self._node_degree[node_id] += len(revive)
+        np.add.at(self._node_degree, self._other_ends(node_id, revive), 1)
+
+    def _other_ends(
+        self,
+        node_id: int,
+        springs: npt.NDArray[np.int32],
+    ) -> npt.NDArray[np.int32]:
+        """Gibt je Feder am Knoten node_id den jeweils anderen Endknoten zurück."""
+        a = self.spring_a[springs]
+        return np.where(a == node_id, self.spring_b[springs], a)
+
+    def find_node(self, node_id: int | None) -> Node | None:
+        """Gibt den Knoten mit der ID zurück, oder None wenn es ihn nicht gibt.
+
+        Knoten-IDs sind dicht (ID = Index in ``nodes``), die Suche ist O(1).
+
+        Parameters
+        ----------
+        node_id : int | None
+            Gesuchte Knoten-ID, z.B. eine gespeicherte Auswahl.
+
+        Returns
+        -------
+        Node | None
+            Der Knoten, oder None für None bzw. eine ungültige ID.
+        """
+        if node_id is None or not 0 <= node_id < len(self.nodes):
+            return None
+        return self.nodes[node_id]
+
+    def incident_springs(self, node_id: int) -> npt.NDArray[np.int32]:
+        """Gibt die IDs aller Federn am Knoten zurück (aktiv und inaktiv).
+
+        Parameters
+        ----------
+        node_id : int
+            ID des Knotens.
+
+        Returns
+        -------
+        npt.NDArray[np.int32]
+            Feder-IDs (Sicht auf die CSR-Adjazenz, nicht verändern).
+        """
+        start = self.node_spring_offsets[node_id]
+        end = self.node_spring_offsets[node_id + 1]
+        return self.node_spring_indices[start:end]
+
+    def _reclassify_springs(self, node_id: int) -> None:
+        """Bestimmt die Orientierung der Federn am Knoten aus der Geometrie neu.
+
+        Wird beim Verschieben eines Knotens aufgerufen, damit Referenzmatrizen
+        und Auto-Steifigkeiten nicht von der Gitterlage ausgehen.
+
+        Parameters
+        ----------
+        node_id : int
+            ID des verschobenen Knotens.
+        """
+        sids = self.incident_springs(node_id)
+        a, b = self.spring_a[sids], self.spring_b[sids]
+        dx = (self.node_x[b] - self.node_x[a]).tolist()
+        dy = (self.node_y[b] - self.node_y[a]).tolist()
+        self.spring_orientation[sids] = [orientation_of(x, y) for x, y in zip(dx, dy)]
+        self._spring_stiffness = None
+
+    def active_spring_indices(self) -> npt.NDArray[np.intp]:
+        """Gibt die IDs aller aktiven Federn zurück.
+
+        Die Indexliste wird bis zur nächsten Änderung von spring_active
+        zwischengespeichert, damit mehrere Gathers pro Solve nicht jeweils
+        die Maske neu auswerten.
+
+        Returns
+        -------
+        npt.NDArray[np.intp]
+            Feder-IDs aufsteigend (schreibgeschützt).
+        """
+        if self._active_springs is None:
+            idx = np.flatnonzero(self.spring_active)
+            idx.flags.writeable = False
+            self._active_springs = idx
+        return self._active_springs
+
+    def node_degrees(self) -> npt.NDArray[np.int64]:
+        """Gibt die Anzahl aktiver Federn je Knoten zurück.
+
+        Der Grad wird von remove_node, restore_node, restore_active_state und
+        dem active-Setter der Federn laufend mitgeführt (O(1) Zugriff).
+
+        Returns
+        -------
+        npt.NDArray[np.int64]
+            Grad je Knoten-ID (Länge = Anzahl Knoten). Live-Array, nicht
+            verändern; für einen festen Stand kopieren.
+        """
+        return self._node_degree
+
+    def active_state(self) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+        """Kopiert die Aktiv-Masken von Knoten und Federn.
+
+        Returns
+        -------
+        tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]
+            (node_active, spring_active) als unabhängige Kopien.
+        """
+        return self.node_active.copy(), self.spring_active.copy()
+
+    def restore_active_state(
+        self,
+        state: tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]],
+    ) -> None:
+        """Setzt die Aktiv-Masken auf einen Zustand aus active_state zurück.
+
+        Parameters
+        ----------
+        state : tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]
+            Zuvor mit active_state gesicherte Masken.
+        """
+        node_active, spring_active = state
+        np.copyto(self.node_active, node_active)
+        np.copyto(self.spring_active, spring_active)
+        self._n_active_nodes = int(np.count_nonzero(self.node_active))
+        self._n_active_springs = int(np.count_nonzero(self.spring_active))
+        self._free_dofs = None
+        self._active_springs = None
+        live = self.active_spring_indices()
+        self._node_degree = (np.bincount(self.spring_a[live], minlength=len(self.node_x))
+                             + np.bincount(self.spring_b[live], minlength=len(self.node_x)))
+
+    def element_matrices(self) -> npt.NDArray[np.float64]:
+        """Gibt die 4x4-Elementmatrizen aller Federn zurück (ohne Materialfaktor).
+
+        Die Geometrie ändert sich während der Optimierung nicht, daher werden
+        die Matrizen einmal berechnet und bis zur nächsten Änderung von k
+        oder einer Knotenkoordinate wiederverwendet.
+
+        Returns
+        -------
+        npt.NDArray[np.float64]
+            Array (S, 4, 4) je Feder-ID (schreibgeschützt).
+        """
+        if self._element_matrices is None:
+            a, b = self.spring_a, self.spring_b
+            Ko = stiffness_matrices(
+                self.node_x[a], self.node_y[a], self.node_x[b], self.node_y[b],
+                self.spring_k, orientation=self.spring_orientation,
+            )
+            Ko.flags.writeable = False
+            self._element_matrices = Ko
+        return self._element_matrices
+
+    def spring_stiffness(self) -> npt.NDArray[np.float64]:
+        """Gibt die wirksame Steifigkeit jeder Feder zurück (ohne Materialfaktor).
+
+        Returns
+        -------
+        npt.NDArray[np.float64]
+            k je Feder-ID, automatische Werte aufgelöst (schreibgeschützt).
+        """
+        if self._spring_stiffness is None:
+            k = resolve_stiffness(self.spring_k, self.spring_orientation)
+            k.flags.writeable = False
+            self._spring_stiffness = k
+        return self._spring_stiffness
+
+    def spring_axes(self) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Gibt Einheitsvektoren und Längen aller Federn zurück.
+
+        Returns
+        -------
+        tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]
+            (e, l0): Richtungen der Form (S, 2) und Längen (S,) je Feder-ID
+            (schreibgeschützt).
+        """
+        if self._spring_axes is None:
+            a, b = self.spring_a, self.spring_b
+            e = np.empty((len(a), 2))
+            np.subtract(self.node_x[b], self.node_x[a], out=e[:, 0])
+            np.subtract(self.node_y[b], self.node_y[a], out=e[:, 1])
+            l0 = np.hypot(e[:, 0], e[:, 1])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                e /= l0[:, None]
+            e.flags.writeable = False
+            l0.flags.writeable = False
+            self._spring_axes = (e, l0)
+        return self._spring_axes
+
+    def stiffness_pattern(
+        self,
+    ) -> tuple[npt.NDArray[np.int32], npt.NDArray[np.int32], npt.NDArray[np.int32]]:
+        """Gibt das CSR-Besetzungsmuster der Steifigkeitsmatrix aller Federn zurück.
+
+        Die 16 Einträge jeder Elementmatrix werden einmalig ihrer Position im
+        CSR-Datenarray zugeordnet. Die Assemblierung summiert dann nur noch
+        die Werte in diese Positionen, ohne COO-Sortierung je Solve.
+
+        Returns
+        -------
+        tuple[npt.NDArray[np.int32], npt.NDArray[np.int32], npt.NDArray[np.int32]]
+            (indptr, indices, slot) mit slot der Form (S, 16): Datenposition
+            des Eintrags [r, c] der Elementmatrix von Feder s in slot[s, 4r + c].
+        """
+        if self._stiffness_pattern is None:
+            self._stiffness_pattern = _build_stiffness_pattern(
+                self.spring_a, self.spring_b, len(self.node_x),
+            )
+        return self._stiffness_pattern
+
+    def free_dofs(self) -> npt.NDArray[np.intp]:
+        """Gibt die Indizes der freien Freiheitsgrade zurück.
+
+        Frei ist ein DOF, wenn sein Knoten aktiv und in der Richtung nicht
+        gelagert ist. Das Ergebnis wird bis zur nächsten Änderung der Lager
+        oder der aktiven Knoten zwischengespeichert.
+
+        Returns
+        -------
+        npt.NDArray[np.intp]
+            Aufsteigend sortierte DOF-Indizes (schreibgeschützt).
+        """
+        if self._free_dofs is None:
+            free = np.empty(2 * len(self.node_x), dtype=bool)
+            free[0::2] = self.node_active & (self.fix_x == 0)
+            free[1::2] = self.node_active & (self.fix_y == 0)
+            free_dofs = np.flatnonzero(free)
+            free_dofs.flags.writeable = False
+            self._free_dofs = free_dofs
+        return self._free_dofs
+
+    def removable_mask(self) -> npt.NDArray[np.bool_]:
+        """Gibt die Knoten ohne Lager und ohne Last zurück (unabhängig von active).
+
+        Nur diese Knoten kommen für die Entfernung in Frage. Die Maske ändert
+        sich während der Optimierung nicht und wird bis zur nächsten Änderung
+        an Lagern oder Kräften zwischengespeichert.
+
+        Returns
+        -------
+        npt.NDArray[np.bool_]
+            Maske je Knoten-ID (schreibgeschützt).
+        """
+        if self._removable is None:
+            removable = ((self.fix_x == 0) & (self.fix_y == 0)
+                         & (self.force_x == 0) & (self.force_y == 0))
+            removable.flags.writeable = False
+            self._removable = removable
+        return self._removable
 
     def active_node_count(self) -> int:
-        """Zählt die aktiven Knoten."""
-        return sum(1 for n in self.nodes if n.active)
+        """Zählt die aktiven Knoten (laufender Zähler, O(1))."""
+        return self._n_active_nodes
 
     def active_spring_count(self) -> int:
-        """Zählt die aktiven Federn."""
-        return sum(1 for s in self.springs if s.active)
+        """Zählt die aktiven Federn (laufender Zähler, O(1))."""
+        return self._n_active_springs
 
     def __str__(self) -> str:
         return (f"Structure({self.width}x{self.height}, "
@@ -1,4 +1,8 @@
-from collections.abc import Callable
+import pickle
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import NamedTuple
 
 import numpy as np
 import numpy.typing as npt
@@ -8,9 +12,66 @@ from solver.fem_solver import solve_structure
 from optimizer.validators import StructureValidator
 
 
+class IndexedValues(NamedTuple):
+    """Werte je ID als parallele Arrays (IDs aufsteigend)."""
+
+    ids: npt.NDArray[np.intp]
+    values: npt.NDArray[np.floating]
+
+    def to_dict(self) -> dict[int, float]:
+        """ID → Wert, für Aufrufer außerhalb des Optimierers."""
+        return dict(zip(self.ids.tolist(), self.values.tolist()))
+
+
 class TopologyOptimizer:
     """Optimiert die Struktur indem unwichtige Knoten schrittweise entfernt werden."""
 
+    @staticmethod
+    def _axial_elongation(
+        structure: Structure,
+        u: npt.NDArray[np.float64],
+        idx: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.float64]:
+        """Längenänderung e_n · (u_b - u_a) der Federn mit den IDs idx."""
+        e, _ = structure.spring_axes()
+        e = e[idx]
+        a = structure.spring_a[idx]
+        b = structure.spring_b[idx]
+        dux = u[2 * b] - u[2 * a]
+        duy = u[2 * b + 1] - u[2 * a + 1]
+        return e[:, 0] * dux + e[:, 1] * duy
+
+    @staticmethod
+    def spring_energy_array(
+        structure: Structure,
+        u: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """Berechnet die Verformungsenergie aller Federn auf einmal.
+
+        Parameters
+        ----------
+        structure : Structure
+            Die Struktur.
+        u : npt.NDArray[np.float64]
+            Verschiebungsvektor aus der FEM-Lösung.
+
+        Returns
+        -------
+        npt.NDArray[np.float64]
+            Energie je Feder-ID (Länge = Anzahl Federn), 0 für inaktive Federn.
+        """
+        energies = np.zeros(len(structure.spring_active))
+        idx = structure.active_spring_indices()
+        if len(idx) == 0:
+            return energies
+
+        # Stabelement: u_eᵀ · Ko · u_e = k · (e_n · Δu)², ohne 4x4-Matrizen
+        E_factor = structure.material.E / 210.0
+        dl = TopologyOptimizer._axial_elongation(structure, u, idx)
+        k = structure.spring_stiffness()[idx]
+        energies[idx] = 0.5 * E_factor * k * dl * dl
+        return energies
+
     @staticmethod
     def compute_spring_energies(
         structure: Structure,
@@ -30,20 +91,37 @@ class TopologyOptimizer:
         dict[int, float]
             Feder-ID → Verformungsenergie.
         """
-        energies: dict[int, float] = {}
-        E_factor = structure.material.E / 210.0
+        energies = TopologyOptimizer.spring_energy_array(structure, u)
+        ids = structure.active_spring_indices()
+        return IndexedValues(ids, energies[ids]).to_dict()
 
-        for spring in structure.springs:
-            if not spring.active:
-                continue
+    @staticmethod
+    def spring_stress_array(
+        structure: Structure,
+        u: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """Berechnet die Normalspannung aller Federn auf einmal.
 
-            i = spring.node_a.id
-            j = spring.node_b.id
-            u_e = np.array([u[2 * i], u[2 * i + 1], u[2 * j], u[2 * j + 1]])
-            Ko = spring.get_stiffness_matrix() * E_factor
-            energies[spring.id] = 0.5 * float(u_e @ Ko @ u_e)
+        Parameters
+        ----------
+        structure : Structure
+            Die Struktur.
+        u : npt.NDArray[np.float64]
+            Verschiebungsvektor aus der FEM-Lösung.
 
-        return energies
+        Returns
+        -------
+        npt.NDArray[np.float64]
+            |σ| in MPa je Feder-ID (Länge = Anzahl Federn), 0 für inaktive Federn.
+        """
+        stresses = np.zeros(len(structure.spring_active))
+        idx = structure.active_spring_indices()
+        _, l0 = structure.spring_axes()
+
+        # ε = e_n · Δu / l₀
+        eps = TopologyOptimizer._axial_elongation(structure, u, idx) / l0[idx]
+        stresses[idx] = np.abs(eps) * 100.0
+        return stresses
 
     @staticmethod
     def compute_spring_stresses(
@@ -64,25 +142,22 @@ class TopologyOptimizer:
         dict[int, float]
             Feder-ID → |σ| in MPa  (σ = E · Δl / l₀).
         """
-        stresses: dict[int, float] = {}
+        stresses = TopologyOptimizer.spring_stress_array(structure, u)
+        ids = structure.active_spring_indices()
+        return IndexedValues(ids, stresses[ids]).to_dict()
 
-        for spring in structure.springs:
-            if not spring.active:
-                continue
-            i   = spring.node_a.id
-            j   = spring.node_b.id
-            e_n = spring.get_direction_vector()
-            l0  = spring.get_length()
-            du  = np.array([u[2 * j] - u[2 * i], u[2 * j + 1] - u[2 * i + 1]])
-            eps = float(np.dot(e_n, du)) / l0
-            stresses[spring.id] = abs(eps) * 100.0
-
-        return stresses
+    @staticmethod
+    def _max_stress(structure: Structure, u: npt.NDArray[np.float64]) -> float | None:
+        """Größte Federspannung, oder None wenn keine Feder aktiv ist."""
+        if structure.active_spring_count() == 0:
+            return None
+        return float(TopologyOptimizer.spring_stress_array(structure, u).max())
 
     @staticmethod
     def compute_node_energies(
         structure: Structure,
         u: npt.NDArray[np.float64],
+        spring_energies: npt.NDArray[np.float64] | None = None,
     ) -> dict[int, float]:
         """Berechnet die Wichtigkeit jedes Knotens aus den Federenergien.
 
@@ -92,33 +167,40 @@ class TopologyOptimizer:
             Die Struktur.
         u : npt.NDArray[np.float64]
             Verschiebungsvektor aus der FEM-Lösung.
+        spring_energies : npt.NDArray[np.float64] | None, optional
+            Bereits berechnete Energien aus spring_energy_array zu u.
 
         Returns
         -------
         dict[int, float]
             Knoten-ID → Wichtigkeit (nur freie, unbelastete Knoten).
         """
-        spring_energies = TopologyOptimizer.compute_spring_energies(structure, u)
+        return TopologyOptimizer._candidate_node_energies(structure, u, spring_energies).to_dict()
 
-        node_energy: dict[int, float] = {}
-        for spring in structure.springs:
-            if not spring.active:
-                continue
-            half_e = spring_energies[spring.id] / 2.0
-            for nid in (spring.node_a.id, spring.node_b.id):
-                node_energy[nid] = node_energy.get(nid, 0.0) + half_e
+    @staticmethod
+    def _candidate_node_energies(
+        structure: Structure,
+        u: npt.NDArray[np.float64],
+        spring_energies: npt.NDArray[np.float64] | None = None,
+    ) -> IndexedValues:
+        """Knotenwichtigkeit der Kandidaten als (IDs, Energien).
 
-        result: dict[int, float] = {}
-        for node in structure.nodes:
-            if not node.active:
-                continue
-            if node.fix_x or node.fix_y:
-                continue
-            if node.force_x != 0 or node.force_y != 0:
-                continue
-            result[node.id] = node_energy.get(node.id, 0.0)
+        Jede aktive Feder gibt die Hälfte ihrer Energie an beide Endknoten ab.
+        Die Endpunkte werden verschränkt [a0, b0, a1, b1, ...] aufsummiert,
+        damit die Additionsreihenfolge je Knoten der Feder-Reihenfolge folgt.
+        """
+        if spring_energies is None:
+            spring_energies = TopologyOptimizer.spring_energy_array(structure, u)
+        idx = structure.active_spring_indices()
+        half_e = spring_energies[idx] / 2.0
+        ends = np.column_stack([structure.spring_a[idx], structure.spring_b[idx]]).ravel()
+        node_energy = np.bincount(
+            ends, weights=np.repeat(half_e, 2), minlength=len(structure.nodes),
+        )
 
-        return result
+        # Nur freie, unbelastete Knoten sind Kandidaten
+        ids = np.flatnonzero(structure.removable_mask() & structure.node_active)
+        return IndexedValues(ids, node_energy[ids])
 
     @staticmethod
     def optimization_step(
@@ -143,7 +225,9 @@ class TopologyOptimizer:
         return None if removed == 0 else removed
 
     @staticmethod
-    def _take_snapshot(structure: Structure) -> dict[str, list[bool]]:
+    def _take_snapshot(
+        structure: Structure,
+    ) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
         """Speichert den aktiven Zustand aller Knoten und Federn.
         Backup falls kinematische Stabilität verloren geht.
 
@@ -154,29 +238,26 @@ class TopologyOptimizer:
 
         Returns
         -------
-        dict[str, list[bool]]
-            Snapshot mit 'nodes' und 'springs' Listen.
+        tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]
+            Kopien der Masken node_active und spring_active.
         """
-        return {
-            "nodes": [n.active for n in structure.nodes],
-            "springs": [s.active for s in structure.springs],
-        }
+        return structure.active_state()
 
     @staticmethod
-    def _restore_snapshot(structure: Structure, snapshot: dict[str, list[bool]]) -> None:
+    def _restore_snapshot(
+        structure: Structure,
+        snapshot: tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]],
+    ) -> None:
         """Stellt den gespeicherten Zustand wieder her.
 
         Parameters
         ----------
         structure : Structure
             Die Struktur.
-        snapshot : dict[str, list[bool]]
+        snapshot : tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]
             Snapshot aus _take_snapshot.
         """
-        for i, active in enumerate(snapshot["nodes"]):
-            structure.nodes[i].active = active
-        for i, active in enumerate(snapshot["springs"]):
-            structure.springs[i].active = active
+        structure.restore_active_state(snapshot)
 
     @staticmethod
     def _restore_node(structure: Structure, node_id: int) -> None:
@@ -189,12 +270,45 @@ class TopologyOptimizer:
         node_id : int
             ID des wiederherzustellenden Knotens.
         """
-        structure.nodes[node_id].active = True
-        for sp in structure.springs:
-            if sp.node_a.id == node_id or sp.node_b.id == node_id:
-                other = sp.node_b if sp.node_a.id == node_id else sp.node_a
-                if other.active:
-                    sp.active = True
+        structure.restore_node(node_id)
+
+    @staticmethod
+    def _ranked_candidates(
+        ids: npt.NDArray[np.intp],
+        energies: npt.NDArray[np.float64],
+        k: int,
+    ) -> Iterator[int]:
+        """Liefert die Knoten-IDs aufsteigend nach Energie (stabil nach ID).
+
+        Zuerst werden per np.partition nur die k kleinsten Energien sortiert;
+        der Rest wird erst sortiert, wenn diese Kandidaten nicht ausreichen.
+        Die Reihenfolge entspricht exakt einer vollständigen stabilen Sortierung.
+
+        Parameters
+        ----------
+        ids : npt.NDArray[np.intp]
+            Knoten-IDs aufsteigend.
+        energies : npt.NDArray[np.float64]
+            Energie je Eintrag von ids.
+        k : int
+            Anzahl der voraussichtlich benötigten Kandidaten.
+
+        Yields
+        ------
+        int
+            Knoten-ID.
+        """
+        if k >= len(energies):
+            yield from ids[np.argsort(energies, kind="stable")].tolist()
+            return
+
+        # Alle Einträge bis einschließlich der k-kleinsten Energie (inkl. Gleichstände)
+        kth = np.partition(energies, k - 1)[k - 1]
+        head = np.flatnonzero(energies <= kth)
+        yield from ids[head[np.argsort(energies[head], kind="stable")]].tolist()
+
+        tail = np.flatnonzero(energies > kth)
+        yield from ids[tail[np.argsort(energies[tail], kind="stable")]].tolist()
 
     @staticmethod
     def optimization_batch(
@@ -205,6 +319,10 @@ class TopologyOptimizer:
         fast_mode: bool = False,
         max_fem_attempts: int = 0,
         use_symmetry: bool = False,
+        spring_energies: npt.NDArray[np.float64] | None = None,
+        stale_tolerance: int = 0,
+        articulation_points: npt.NDArray[np.bool_] | None = None,
+        candidates: IndexedValues | None = None,
     ) -> int:
         """Entfernt bis zu batch_size Knoten auf Basis einer FEM-Lösung.
 
@@ -212,6 +330,10 @@ class TopologyOptimizer:
         durchlaufen aber die Mechanismus-Prüfung. Alle anderen
         durchlaufen den vollen can_remove_node-Check.
 
+        Mit stale_tolerance > 0 werden nach den batch_size Entfernungen
+        weitere Kandidaten aus derselben (dann veralteten) Energie-Rangfolge
+        entfernt, jeweils nur mit dem vollen can_remove_node-Check.
+
         Parameters
         ----------
         structure : Structure
@@ -230,57 +352,87 @@ class TopologyOptimizer:
         use_symmetry : bool
             Wenn True, wird beim Entfernen eines Knotens auch der
             linkssymmetrische Spiegelknoten entfernt (falls möglich).
+        spring_energies : npt.NDArray[np.float64] | None
+            Bereits berechnete Federenergien zu u (aus spring_energy_array),
+            vermeidet eine zweite Auswertung.
+        stale_tolerance : int
+            Max. zusätzliche Entfernungen ohne neuen FEM-Solve (0 = aus).
+        articulation_points : npt.NDArray[np.bool_] | None
+            Bereits berechnete Artikulationspunkte des aktuellen Zustands
+            (aus StructureValidator.articulation_points), nur bei fast_mode.
+        candidates : IndexedValues | None
+            Bereits berechnete Kandidaten-Energien zu u (aus
+            _candidate_node_energies), vermeidet eine zweite Auswertung.
 
         Returns
         -------
         int
             Anzahl tatsächlich entfernter Knoten.
         """
-        node_energies = TopologyOptimizer.compute_node_energies(structure, u)
-        if not node_energies:
+        if candidates is None:
+            candidates = TopologyOptimizer._candidate_node_energies(
+                structure, u, spring_energies,
+            )
+        if len(candidates.ids) == 0:
             return 0
 
-        degree: dict[int, int] = {}
-        for sp in structure.springs:
-            if sp.active:
-                degree[sp.node_a.id] = degree.get(sp.node_a.id, 0) + 1
-                degree[sp.node_b.id] = degree.get(sp.node_b.id, 0) + 1
+        # Grade zu Beginn des Batches; Entfernungen im Batch ändern sie nicht
+        degree = structure.node_degrees().copy()
 
-        protected: set[int] = set()
+        protected: npt.NDArray[np.bool_] | None = None
         if fast_mode:
-            import networkx as nx
-            G = nx.Graph()
-            G.add_nodes_from(n.id for n in structure.nodes if n.active)
-            G.add_edges_from(
-                (sp.node_a.id, sp.node_b.id)
-                for sp in structure.springs if sp.active
-            )
             # Schutz vor globalem Strukturversagen
-            protected = set(nx.articulation_points(G))
+            protected = articulation_points
+            if protected is None:
+                protected = StructureValidator.articulation_points(structure)
 
-        sorted_nodes = sorted(node_energies.items(), key=lambda x: x[1])
+        # Reserve für Kandidaten, die an can_remove_node scheitern
+        sorted_nodes = TopologyOptimizer._ranked_candidates(
+            candidates.ids, candidates.values, 4 * (batch_size + stale_tolerance),
+        )
         removed = 0
         fem_attempts = 0
         processed: set[int] = set()
+        # Lager und Lasten ändern sich im Batch nicht
+        removable = structure.removable_mask()
+
+        # Ist der Graph zusammenhängend und gelagert, zerteilt nur das Entfernen
+        # eines Artikulationspunkts ihn oder trennt Lastpfade; alle anderen
+        # Knoten brauchen nur die Mechanismus-Prüfung. Die Maske wird nach
+        # jeder Änderung bei Bedarf neu bestimmt.
+        exact_articulation = (
+            not fast_mode
+            and StructureValidator.is_connected(structure)
+            and bool((structure.node_active
+                      & ((structure.fix_x != 0) | (structure.fix_y != 0))).any())
+        )
+        articulation: npt.NDArray[np.bool_] | None = None
 
-        for node_id, _ in sorted_nodes:
-            if removed >= batch_size:
+        for node_id in sorted_nodes:
+            if removed >= batch_size + stale_tolerance:
                 break
             if node_id in processed:
                 continue
 
-            if fast_mode:
-                if node_id in protected:
+            # Grade und Artikulationspunkte stammen vom Batch-Beginn und
+            # gelten für veraltete Entfernungen nicht mehr
+            stale = removed >= batch_size
+            if stale or (not fast_mode and degree[node_id] > 1):
+                if exact_articulation and articulation is None:
+                    articulation = StructureValidator.articulation_points(structure)
+                can_remove = StructureValidator.can_remove_node(
+                    structure, node_id, articulation,
+                )
+            elif fast_mode:
+                if protected[node_id]:
                     continue
                 can_remove = StructureValidator.neighbors_stable_after_removal(
                     structure, node_id,
                 )
-            elif degree.get(node_id, 0) <= 1:
+            else:
                 can_remove = StructureValidator.neighbors_stable_after_removal(
                     structure, node_id,
                 )
-            else:
-                can_remove = StructureValidator.can_remove_node(structure, node_id)
 
             if not can_remove:
                 continue
@@ -288,34 +440,38 @@ class TopologyOptimizer:
             # Spiegelknoten für Symmetrie bestimmen
             mirror_id: int | None = None
             if use_symmetry:
-                x = node_id % structure.width
-                y = node_id // structure.width
-                m_id = y * structure.width + (structure.width - 1 - x)
-                if m_id != node_id and m_id not in processed and structure.nodes[m_id].active:
-                    mn = structure.nodes[m_id]
-                    if not mn.fix_x and not mn.fix_y and mn.force_x == 0 and mn.force_y == 0:
-                        mirror_id = m_id
+                m_id = int(structure.node_mirror[node_id])
+                if (m_id != node_id and m_id not in processed
+                        and structure.node_active[m_id] and removable[m_id]):
+                    mirror_id = m_id
 
             structure.remove_node(node_id)
             processed.add(node_id)
+            articulation = None
 
             if mirror_id is not None:
-                m_deg = degree.get(mirror_id, 0)
-                if fast_mode:
-                    m_can = mirror_id not in protected and StructureValidator.neighbors_stable_after_removal(structure, mirror_id)
-                elif m_deg <= 1:
-                    m_can = StructureValidator.neighbors_stable_after_removal(structure, mirror_id)
+                m_deg = degree[mirror_id]
+                if stale or (not fast_mode and m_deg > 1):
+                    if exact_articulation:
+                        articulation = StructureValidator.articulation_points(structure)
+                    m_can = StructureValidator.can_remove_node(
+                        structure, mirror_id, articulation,
+                    )
+                elif fast_mode:
+                    m_can = not protected[mirror_id] and StructureValidator.neighbors_stable_after_removal(structure, mirror_id)
                 else:
-                    m_can = StructureValidator.can_remove_node(structure, mirror_id)
+                    m_can = StructureValidator.neighbors_stable_after_removal(structure, mirror_id)
                 if m_can:
                     structure.remove_node(mirror_id)
                     processed.add(mirror_id)
+                    articulation = None
                 else:
                     mirror_id = None
 
             if validate_fem:
                 fem_attempts += 1
                 if solve_structure(structure) is None:
+                    articulation = None
                     TopologyOptimizer._restore_node(structure, node_id)
                     processed.discard(node_id)
                     if mirror_id is not None:
@@ -363,6 +519,17 @@ class TopologyOptimizer:
             return max(1, int(n_active * frac))
         return 1
 
+    @staticmethod
+    def _near_minimum_count(energies: npt.NDArray[np.float64], tol: float) -> int:
+        """Anzahl der Kandidaten mit Energie ≤ E_min · (1 + tol).
+
+        Knoten mit nahezu gleicher, kleinster Energie beeinflussen die
+        Rangfolge untereinander kaum und können gemeinsam entfernt werden.
+        """
+        if len(energies) == 0:
+            return 0
+        return int(np.count_nonzero(energies <= energies.min() * (1.0 + tol)))
+
     @staticmethod
     def run(
         structure: Structure,
@@ -371,6 +538,9 @@ class TopologyOptimizer:
         stress_ratio_limit: float | None = None,
         fast_mode: bool = False,
         use_symmetry: bool = False,
+        stale_tolerance: int = 0,
+        fallback_workers: int = 1,
+        batch_energy_tol: float = 0.0,
     ) -> list[float]:
         """Führt die Optimierung durch bis der Massenanteil erreicht ist.
 
@@ -393,6 +563,16 @@ class TopologyOptimizer:
         use_symmetry : bool
             Wenn True, wird beim Entfernen eines Knotens auch der
             linkssymmetrische Spiegelknoten entfernt (falls möglich).
+        stale_tolerance : int
+            Max. zusätzliche Entfernungen pro Batch aus der Rangfolge des
+            letzten Solves, ohne erneuten FEM-Solve (0 = aus).
+        fallback_workers : int
+            Prozesse für den Halbierungs-Fallback im fast_mode (1 = sequentiell,
+            empfohlen). Parallele Versuche sind experimentell, siehe
+            _halving_fallback.
+        batch_energy_tol : float
+            Wenn > 0, wird der Batch auf alle Kandidaten mit Energie
+            ≤ E_min · (1 + tol) vergrößert (0 = aus).
 
         Returns
         -------
@@ -400,6 +580,10 @@ class TopologyOptimizer:
             Gesamtenergie nach jedem FEM-Solve.
         """
         assert 0.0 < mass_fraction < 1.0, "mass_fraction muss zwischen 0 und 1 liegen."
+        assert stale_tolerance >= 0, "stale_tolerance darf nicht negativ sein."
+        assert batch_energy_tol >= 0.0, "batch_energy_tol darf nicht negativ sein."
+        if fallback_workers < 1:
+            raise ValueError(f"fallback_workers muss mindestens 1 sein, ist {fallback_workers}.")
 
         total_nodes = len(structure.nodes)
         target_nodes = max(2, int(total_nodes * mass_fraction))
@@ -411,32 +595,59 @@ class TopologyOptimizer:
         if stress_ratio_limit is not None:
             u_ref = solve_structure(structure)
             if u_ref is not None:
-                ref_stresses = TopologyOptimizer.compute_spring_stresses(structure, u_ref)
-                stress_ref = max(ref_stresses.values()) if ref_stresses else None
+                stress_ref = TopologyOptimizer._max_stress(structure, u_ref)
 
         if on_progress:
             on_progress(0.0, total_nodes, target_nodes)
 
-        consecutive_failures = 0
-        snapshot = None
-        snapshot_u = None
-        max_reported_progress = 0.0
-        min_reported_active = total_nodes
-
-        while structure.active_node_count() > target_nodes:
-            u = solve_structure(structure)
-
-            if u is None:
-                if snapshot is None:
-                    break
-                TopologyOptimizer._restore_snapshot(structure, snapshot)
-                if fast_mode:
-                    halved = TopologyOptimizer._halving_fallback(
-                        structure, snapshot_u,
-                        structure.active_node_count() - target_nodes, fast_mode=True,
+        # Ein Prozess-Pool für alle Fallbacks des Laufs; die Worker starten
+        # erst mit dem ersten parallelen Versuch. Jede Welle ist bei der
+        # Rückkehr aus _halving_fallback abgeschlossen, shutdown wartet nur
+        # nach einer Ausnahme noch auf laufende Versuche.
+        pool: ProcessPoolExecutor | None = None
+        if fast_mode and fallback_workers > 1:
+            pool = ProcessPoolExecutor(max_workers=fallback_workers)
+        try:
+            consecutive_failures = 0
+            snapshot = None
+            snapshot_u = None
+            snapshot_energies = None
+            # True, solange der aktuelle Zustand seit dem letzten Solve unverändert ist
+            last_solve_ok = False
+            max_reported_progress = 0.0
+            min_reported_active = total_nodes
+
+            while structure.active_node_count() > target_nodes:
+                u = solve_structure(structure)
+
+                if u is None:
+                    if snapshot is None:
+                        break
+                    TopologyOptimizer._restore_snapshot(structure, snapshot)
+                    if fast_mode:
+                        halved = TopologyOptimizer._halving_fallback(
+                            structure, snapshot_u,
+                            structure.active_node_count() - target_nodes, fast_mode=True,
+                            spring_energies=snapshot_energies, workers=fallback_workers,
+                            pool=pool,
+                        )
+                        snapshot = None
+                        if halved == 0:
+                            break
+                        n_active = structure.active_node_count()
+                        removed_so_far = total_nodes - n_active
+                        progress = min(removed_so_far / nodes_to_remove, 1.0) if nodes_to_remove > 0 else 1.0
+                        if on_progress:
+                            max_reported_progress = max(max_reported_progress, progress)
+                            min_reported_active = min(min_reported_active, n_active)
+                            on_progress(max_reported_progress, min_reported_active, target_nodes)
+                        continue
+                    removed = TopologyOptimizer.optimization_batch(
+                        structure, snapshot_u, batch_size=1, validate_fem=True,
+                        use_symmetry=use_symmetry, spring_energies=snapshot_energies,
                     )
                     snapshot = None
-                    if halved == 0:
+                    if removed == 0:
                         break
                     n_active = structure.active_node_count()
                     removed_so_far = total_nodes - n_active
@@ -446,13 +657,60 @@ class TopologyOptimizer:
                         min_reported_active = min(min_reported_active, n_active)
                         on_progress(max_reported_progress, min_reported_active, target_nodes)
                     continue
+
+                last_solve_ok = True
+
+                if stress_ref is not None and stress_ratio_limit is not None:
+                    stress_max = TopologyOptimizer._max_stress(structure, u)
+                    if stress_max is not None and stress_max / stress_ref > stress_ratio_limit:
+                        break
+
+                spring_energies = TopologyOptimizer.spring_energy_array(structure, u)
+                energy_history.append(float(spring_energies.sum()))
+
+                n_active = structure.active_node_count()
+                removed_so_far = total_nodes - n_active
+                progress = min(removed_so_far / nodes_to_remove, 1.0) if nodes_to_remove > 0 else 1.0
+
+                if fast_mode:
+                    if progress < 0.50:
+                        frac = 0.03
+                    elif progress < 0.80:
+                        frac = 0.015
+                    else:
+                        frac = 0.005
+                    batch_size = min(30, max(1, int(n_active * frac)))
+                else:
+                    batch_size = TopologyOptimizer._adaptive_batch_size(progress, n_active)
+                candidates = None
+                if batch_energy_tol > 0.0:
+                    candidates = TopologyOptimizer._candidate_node_energies(
+                        structure, u, spring_energies,
+                    )
+                    batch_size = max(batch_size, TopologyOptimizer._near_minimum_count(
+                        candidates.values, batch_energy_tol,
+                    ))
+                batch_size = min(batch_size, n_active - target_nodes)
+                stale = min(stale_tolerance, n_active - target_nodes - batch_size)
+
+                snapshot = TopologyOptimizer._take_snapshot(structure)
+                snapshot_u = u
+                snapshot_energies = spring_energies
+
                 removed = TopologyOptimizer.optimization_batch(
-                    structure, snapshot_u, batch_size=1, validate_fem=True,
-                    use_symmetry=use_symmetry,
+                    structure, u, batch_size, fast_mode=fast_mode,
+                    use_symmetry=use_symmetry, spring_energies=spring_energies,
+                    stale_tolerance=stale, candidates=candidates,
                 )
-                snapshot = None
                 if removed == 0:
-                    break
+                    consecutive_failures += 1
+                    if consecutive_failures >= 3:
+                        break
+                    continue
+
+                consecutive_failures = 0
+                last_solve_ok = False
+                TopologyOptimizer._cleanup_dangling(structure)
                 n_active = structure.active_node_count()
                 removed_so_far = total_nodes - n_active
                 progress = min(removed_so_far / nodes_to_remove, 1.0) if nodes_to_remove > 0 else 1.0
@@ -460,63 +718,19 @@ class TopologyOptimizer:
                     max_reported_progress = max(max_reported_progress, progress)
                     min_reported_active = min(min_reported_active, n_active)
                     on_progress(max_reported_progress, min_reported_active, target_nodes)
-                continue
-
-            if stress_ref is not None and stress_ratio_limit is not None:
-                cur_stresses = TopologyOptimizer.compute_spring_stresses(structure, u)
-                if cur_stresses:
-                    stress_max = max(cur_stresses.values())
-                    if stress_max / stress_ref > stress_ratio_limit:
-                        break
-
-            spring_energies = TopologyOptimizer.compute_spring_energies(structure, u)
-            energy_history.append(sum(spring_energies.values()))
 
-            n_active = structure.active_node_count()
-            removed_so_far = total_nodes - n_active
-            progress = min(removed_so_far / nodes_to_remove, 1.0) if nodes_to_remove > 0 else 1.0
-
-            if fast_mode:
-                if progress < 0.50:
-                    frac = 0.03
-                elif progress < 0.80:
-                    frac = 0.015
-                else:
-                    frac = 0.005
-                batch_size = min(30, max(1, int(n_active * frac)))
-            else:
-                batch_size = TopologyOptimizer._adaptive_batch_size(progress, n_active)
-            batch_size = min(batch_size, n_active - target_nodes)
-
-            snapshot = TopologyOptimizer._take_snapshot(structure)
-            snapshot_u = u
-
-            removed = TopologyOptimizer.optimization_batch(
-                structure, u, batch_size, fast_mode=fast_mode,
-                use_symmetry=use_symmetry,
-            )
-            if removed == 0:
-                consecutive_failures += 1
-                if consecutive_failures >= 3:
-                    break
-                continue
+            # Nur prüfen, wenn der letzte Batch noch nicht gelöst wurde; nach einem
+            # Abbruch durch das Spannungslimit oder erfolglose Batches ist der
+            # Zustand bereits mit dem letzten Solve verifiziert.
+            if snapshot is not None and not last_solve_ok and solve_structure(structure) is None:
+                TopologyOptimizer._restore_snapshot(structure, snapshot)
 
-            consecutive_failures = 0
             TopologyOptimizer._cleanup_dangling(structure)
-            n_active = structure.active_node_count()
-            removed_so_far = total_nodes - n_active
-            progress = min(removed_so_far / nodes_to_remove, 1.0) if nodes_to_remove > 0 else 1.0
-            if on_progress:
-                max_reported_progress = max(max_reported_progress, progress)
-                min_reported_active = min(min_reported_active, n_active)
-                on_progress(max_reported_progress, min_reported_active, target_nodes)
-
-        if snapshot is not None and solve_structure(structure) is None:
-            TopologyOptimizer._restore_snapshot(structure, snapshot)
-
-        TopologyOptimizer._cleanup_dangling(structure)
 
-        return energy_history
+            return energy_history
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
 
     @staticmethod
     def _halving_fallback(
@@ -524,9 +738,19 @@ class TopologyOptimizer:
         u: npt.NDArray[np.float64],
         remaining: int,
         fast_mode: bool = False,
+        spring_energies: npt.NDArray[np.float64] | None = None,
+        workers: int = 1,
+        pool: Executor | None = None,
     ) -> int:
         """Halbiert die Batch-Größe bis eine Entfernung FEM-stabil ist.
 
+        Mit workers > 1 (experimentell) werden die Batch-Größen in Wellen zu
+        je workers Versuchen, größte zuerst, parallel auf Kopien der
+        Struktur versucht. Übernommen wird wie im sequentiellen Fall der
+        größte erfolgreiche Versuch; nach der ersten Welle mit Erfolg werden
+        keine weiteren Versuche gestartet. Lohnt sich nur, wenn der Solve
+        gegenüber Prozess-Kommunikation und Pickeln dominiert.
+
         Parameters
         ----------
         structure : Structure
@@ -537,26 +761,95 @@ class TopologyOptimizer:
             Verbleibende zu entfernende Knoten.
         fast_mode : bool
             Ob schnelle Prüfungen verwendet werden sollen.
+        spring_energies : npt.NDArray[np.float64] | None
+            Bereits berechnete Federenergien zu u.
+        workers : int
+            Anzahl paralleler Versuche je Welle (1 = sequentiell).
+        pool : Executor | None
+            Vorhandener Prozess-Pool mit workers Prozessen. Wenn None und
+            workers > 1, wird ein Pool für diesen Aufruf angelegt.
 
         Returns
         -------
         int
             Anzahl entfernter Knoten, oder 0 bei Misserfolg.
         """
+        # Jeder Versuch startet vom selben Zustand, Energien und
+        # Artikulationspunkte bleiben gültig
+        if spring_energies is None:
+            spring_energies = TopologyOptimizer.spring_energy_array(structure, u)
+        articulation = StructureValidator.articulation_points(structure) if fast_mode else None
+
+        # Absteigende Batch-Größen; Wiederholungen derselben Größe sind
+        # deterministisch und werden übersprungen
+        sizes: list[int] = []
         batch_size = min(20, remaining)
-        snapshot = TopologyOptimizer._take_snapshot(structure)
-
         for _ in range(6):
+            if batch_size not in sizes:
+                sizes.append(batch_size)
+            batch_size = max(1, batch_size // 2)
+
+        if workers > 1 and len(sizes) > 1:
+            if pool is None:
+                with ProcessPoolExecutor(max_workers=workers) as own_pool:
+                    return TopologyOptimizer._parallel_fallback(
+                        structure, u, sizes, fast_mode, spring_energies,
+                        articulation, own_pool, workers,
+                    )
+            return TopologyOptimizer._parallel_fallback(
+                structure, u, sizes, fast_mode, spring_energies,
+                articulation, pool, workers,
+            )
+
+        snapshot = TopologyOptimizer._take_snapshot(structure)
+        for batch_size in sizes:
             removed = TopologyOptimizer.optimization_batch(
                 structure, u, batch_size, fast_mode=fast_mode,
+                spring_energies=spring_energies, articulation_points=articulation,
             )
             if removed > 0 and solve_structure(structure) is not None:
                 return removed
             TopologyOptimizer._restore_snapshot(structure, snapshot)
-            batch_size = max(1, batch_size // 2)
 
         return 0
 
+    @staticmethod
+    def _parallel_fallback(
+        structure: Structure,
+        u: npt.NDArray[np.float64],
+        sizes: list[int],
+        fast_mode: bool,
+        spring_energies: npt.NDArray[np.float64],
+        articulation: npt.NDArray[np.bool_] | None,
+        pool: Executor,
+        workers: int,
+    ) -> int:
+        """Versucht die Batch-Größen in Wellen zu je workers im Pool.
+
+        Die Struktur wird einmal gepickelt (nur Arrays und CSR, siehe
+        Structure.__getstate__) und jedem Versuch als Bytes mitgegeben.
+        Jede Welle wird vollständig abgewartet: Versuche, die neben dem
+        übernommenen liefen, rechnen ihren Solve zu Ende und werden
+        verworfen, sodass beim Rückgabezeitpunkt nichts mehr im Pool läuft.
+        Innerhalb einer Welle gewinnt wie sequentiell die größte
+        erfolgreiche Größe.
+        """
+        payload = pickle.dumps((structure, u, spring_energies, articulation),
+                               protocol=pickle.HIGHEST_PROTOCOL)
+        for start in range(0, len(sizes), workers):
+            futures = [
+                pool.submit(_fallback_attempt, payload, size, fast_mode)
+                for size in sizes[start:start + workers]
+            ]
+            results = [future.result() for future in futures]
+            for removed, state, u_new in results:
+                if removed > 0:
+                    structure.restore_active_state(state)
+                    structure.u_x[:] = u_new[0::2]
+                    structure.u_y[:] = u_new[1::2]
+                    return removed
+        return 0
+
     @staticmethod
     def _cleanup_dangling(structure: Structure) -> int:
         """Entfernt iterativ alle Endknoten (Grad ≤ 1) die keine Lager oder Kräfte tragen.
@@ -571,27 +864,26 @@ class TopologyOptimizer:
         int
             Anzahl entfernter Knoten.
         """
+        degree = structure.node_degrees()
+        removable = structure.removable_mask()
+        leaves = deque(np.flatnonzero(
+            structure.node_active & removable & (degree <= 1),
+        ).tolist())
+
+        # Worklist: nach einer Entfernung können nur deren Nachbarn neu zu
+        # Endknoten werden; das Ergebnis entspricht dem wiederholten Scan
         total_removed = 0
-        changed = True
-        while changed:
-            changed = False
-            degree: dict[int, int] = {}
-            for sp in structure.springs:
-                if sp.active:
-                    degree[sp.node_a.id] = degree.get(sp.node_a.id, 0) + 1
-                    degree[sp.node_b.id] = degree.get(sp.node_b.id, 0) + 1
-
-            for node in structure.nodes:
-                if not node.active:
-                    continue
-                if node.fix_x or node.fix_y:
-                    continue
-                if node.force_x != 0 or node.force_y != 0:
-                    continue
-                if degree.get(node.id, 0) <= 1:
-                    structure.remove_node(node.id)
-                    total_removed += 1
-                    changed = True
+        while leaves:
+            node_id = leaves.popleft()
+            if not structure.node_active[node_id]:
+                continue
+            incident = structure.incident_springs(node_id)
+            neighbors = structure._other_ends(node_id, incident[structure.spring_active[incident]])
+            structure.remove_node(node_id)
+            total_removed += 1
+            for nb in neighbors.tolist():
+                if removable[nb] and degree[nb] <= 1:
+                    leaves.append(nb)
 
         return total_removed
 
@@ -633,6 +925,42 @@ class TopologyOptimizer:
         )
 
 
+def _fallback_attempt(
+    payload: bytes,
+    batch_size: int,
+    fast_mode: bool,
+) -> tuple[int, tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]] | None,
+           npt.NDArray[np.float64] | None]:
+    """Ein Versuch des Halbierungs-Fallbacks auf einer Kopie (Worker-Prozess).
+
+    Parameters
+    ----------
+    payload : bytes
+        Gepickeltes (structure, u, spring_energies, articulation).
+    batch_size : int
+        Batch-Größe dieses Versuchs.
+    fast_mode : bool
+        Ob schnelle Prüfungen verwendet werden sollen.
+
+    Returns
+    -------
+    tuple
+        (entfernte Knoten, Aktiv-Zustand, Verschiebungen), bei Misserfolg
+        (0, None, None).
+    """
+    structure, u, spring_energies, articulation = pickle.loads(payload)
+    removed = TopologyOptimizer.optimization_batch(
+        structure, u, batch_size, fast_mode=fast_mode,
+        spring_energies=spring_energies, articulation_points=articulation,
+    )
+    if removed == 0:
+        return 0, None, None
+    u_new = solve_structure(structure)
+    if u_new is None:
+        return 0, None, None
+    return removed, structure.active_state(), u_new
+
+
 if __name__ == "__main__":
     from model.structure import Structure
 
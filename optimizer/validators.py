@@ -1,6 +1,7 @@
 import numpy as np
 import numpy.typing as npt
-import networkx as nx
+import scipy.sparse
+from scipy.sparse.csgraph import connected_components
 
 from model.structure import Structure
 
@@ -8,6 +9,22 @@ from model.structure import Structure
 class StructureValidator:
     """Prüft ob die Struktur zusammenhängend bleibt und Lastpfade existieren."""
 
+    @staticmethod
+    def _component_labels(structure: Structure) -> npt.NDArray[np.int32]:
+        """Zusammenhangskomponente je Knoten im Graphen der aktiven Federn.
+
+        Inaktive Knoten haben keine aktiven Federn und bilden jeweils eine
+        eigene Komponente.
+        """
+        n = len(structure.nodes)
+        idx = structure.active_spring_indices()
+        A = scipy.sparse.csr_matrix(
+            (np.ones(len(idx), dtype=np.int8), (structure.spring_a[idx], structure.spring_b[idx])),
+            shape=(n, n),
+        )
+        _, labels = connected_components(A, directed=False)
+        return labels
+
     @staticmethod
     def is_connected(structure: Structure) -> bool:
         """Prüft ob alle aktiven Knoten miteinander verbunden sind.
@@ -22,18 +39,12 @@ class StructureValidator:
         bool
             True wenn zusammenhängend.
         """
-        active_ids = [n.id for n in structure.nodes if n.active]
+        active_ids = np.flatnonzero(structure.node_active)
         if len(active_ids) <= 1:
             return True
 
-        G = nx.Graph()
-        G.add_nodes_from(active_ids)
-        G.add_edges_from(
-            (s.node_a.id, s.node_b.id)
-            for s in structure.springs
-            if s.active
-        )
-        return nx.is_connected(G)
+        labels = StructureValidator._component_labels(structure)
+        return bool((labels[active_ids] == labels[active_ids[0]]).all())
 
     @staticmethod
     def has_load_paths(structure: Structure) -> bool:
@@ -49,30 +60,88 @@ class StructureValidator:
         bool
             True wenn alle Kräfte zu einem Lager geleitet werden können.
         """
-        G = nx.Graph()
-        G.add_nodes_from(n.id for n in structure.nodes if n.active)
-        G.add_edges_from(
-            (s.node_a.id, s.node_b.id)
-            for s in structure.springs
-            if s.active
-        )
+        active = structure.node_active
+        supports = active & ((structure.fix_x != 0) | (structure.fix_y != 0))
+        if not supports.any():
+            return False
 
-        support_ids = {
-            n.id for n in structure.nodes
-            if n.active and (n.fix_x or n.fix_y)
-        }
+        forces = active & ((structure.force_x != 0) | (structure.force_y != 0))
+        if not forces.any():
+            return True
 
-        if not support_ids:
-            return False
+        # Eine Komponentenbestimmung statt has_path je Kraft-Lager-Paar:
+        # jeder Kraftknoten muss in einer Komponente mit einem Lager liegen
+        labels = StructureValidator._component_labels(structure)
+        return bool(np.isin(labels[forces], labels[supports]).all())
 
-        for node in structure.nodes:
-            if not node.active:
-                continue
-            if node.force_x != 0 or node.force_y != 0:
-                if not any(nx.has_path(G, node.id, s_id) for s_id in support_ids):
-                    return False
+    @staticmethod
+    def articulation_points(structure: Structure) -> npt.NDArray[np.bool_]:
+        """Bestimmt die Artikulationspunkte des Graphen der aktiven Federn.
 
-        return True
+        Iterativer Tarjan-Algorithmus direkt auf einer Nachbarliste aus den
+        SoA-Arrays, ohne Aufbau eines networkx-Graphen.
+
+        Parameters
+        ----------
+        structure : Structure
+            Die Struktur.
+
+        Returns
+        -------
+        npt.NDArray[np.bool_]
+            True für Knoten, deren Entfernung den Graphen zerteilt.
+        """
+        n = len(structure.nodes)
+        idx = structure.active_spring_indices()
+        a, b = structure.spring_a[idx], structure.spring_b[idx]
+        ends = np.concatenate([a, b])
+        order = np.argsort(ends, kind="stable")
+        nbrs = np.concatenate([b, a])[order].tolist()
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(ends, minlength=n), out=offsets[1:])
+        off = offsets.tolist()
+
+        disc = [-1] * n
+        low = [0] * n
+        parent = [-1] * n
+        ptr = off[:-1]
+        is_art = [False] * n
+        timer = 0
+
+        for root in np.flatnonzero(structure.node_active).tolist():
+            if disc[root] != -1:
+                continue
+            disc[root] = low[root] = timer
+            timer += 1
+            root_children = 0
+            stack = [root]
+            while stack:
+                v = stack[-1]
+                p = ptr[v]
+                if p < off[v + 1]:
+                    ptr[v] = p + 1
+                    w = nbrs[p]
+                    if disc[w] == -1:
+                        parent[w] = v
+                        disc[w] = low[w] = timer
+                        timer += 1
+                        stack.append(w)
+                        if v == root:
+                            root_children += 1
+                    elif w != parent[v] and disc[w] < low[v]:
+                        low[v] = disc[w]
+                else:
+                    stack.pop()
+                    if stack:
+                        u = stack[-1]
+                        if low[v] < low[u]:
+                            low[u] = low[v]
+                        if u != root and low[v] >= disc[u]:
+                            is_art[u] = True
+            if root_children > 1:
+                is_art[root] = True
+
+        return np.array(is_art, dtype=bool)
 
     @staticmethod
     def neighbors_stable_after_removal(structure: Structure, node_id: int) -> bool:
@@ -93,50 +162,38 @@ class StructureValidator:
         bool
             True wenn alle Nachbarn nach Entfernung stabil bleiben.
         """
-        affected_spring_ids: set[int] = set()
-        neighbors: set[int] = set()
+        incident = structure.incident_springs(node_id)
+        neighbors = structure._other_ends(node_id, incident[structure.spring_active[incident]])
+        removable = structure.removable_mask()
+        e, _ = structure.spring_axes()
 
-        for sp in structure.springs:
-            if not sp.active:
-                continue
-            if sp.node_a.id == node_id:
-                affected_spring_ids.add(sp.id)
-                neighbors.add(sp.node_b.id)
-            elif sp.node_b.id == node_id:
-                affected_spring_ids.add(sp.id)
-                neighbors.add(sp.node_a.id)
-
-        for nid in neighbors:
-            node = structure.nodes[nid]
-            if not node.active:
-                continue
-            if node.fix_x or node.fix_y:
-                continue
-            if node.force_x != 0 or node.force_y != 0:
+        for nid in neighbors.tolist():
+            if not structure.node_active[nid] or not removable[nid]:
                 continue
 
-            directions: list[npt.NDArray[np.float64]] = []
-            for sp in structure.springs:
-                if not sp.active or sp.id in affected_spring_ids:
-                    continue
-                if sp.node_a.id == nid or sp.node_b.id == nid:
-                    directions.append(sp.get_direction_vector())
+            # Aktive Federn am Nachbarn ohne die Federn zum entfernten Knoten,
+            # in Feder-ID-Reihenfolge (bestimmt die Referenzrichtung)
+            inc = structure.incident_springs(nid)
+            remaining = inc[structure.spring_active[inc]]
+            remaining = np.sort(remaining[structure._other_ends(nid, remaining) != node_id])
 
-            if len(directions) < 3:
+            if len(remaining) < 3:
                 return False
 
+            directions = e[remaining]
             ref = directions[0]
-            all_parallel = all(
-                abs(ref[0] * d[1] - ref[1] * d[0]) < 1e-6
-                for d in directions[1:]
-            )
-            if all_parallel:
+            cross = ref[0] * directions[1:, 1] - ref[1] * directions[1:, 0]
+            if np.all(np.abs(cross) < 1e-6):
                 return False
 
         return True
 
     @staticmethod
-    def can_remove_node(structure: Structure, node_id: int) -> bool:
+    def can_remove_node(
+        structure: Structure,
+        node_id: int,
+        articulation: npt.NDArray[np.bool_] | None = None,
+    ) -> bool:
         """Prüft ob ein Knoten entfernt werden kann ohne die Struktur zu zerstören.
 
         Prüft drei Bedingungen:
@@ -150,6 +207,13 @@ class StructureValidator:
             Die Struktur.
         node_id : int
             ID des Knotens.
+        articulation : ndarray of bool, optional
+            Artikulationsmaske des aktuellen Zustands (siehe
+            ``articulation_points``). Darf nur übergeben werden, wenn der
+            Graph zusammenhängend und gelagert ist: Dann erhält das Entfernen
+            eines Nicht-Artikulationspunkts Zusammenhang und Lastpfade, das
+            eines Artikulationspunkts zerteilt den Graphen immer, und das
+            probeweise Entfernen entfällt.
 
         Returns
         -------
@@ -159,22 +223,20 @@ class StructureValidator:
         node = structure.nodes[node_id]
         assert node.active, f"Knoten {node_id} ist bereits inaktiv."
 
+        if articulation is not None and articulation[node_id]:
+            return False
         if not StructureValidator.neighbors_stable_after_removal(structure, node_id):
             return False
+        if articulation is not None:
+            return True
 
-        node.active = False
-        affected_springs = []
-        for spring in structure.springs:
-            if spring.active and (spring.node_a.id == node_id or spring.node_b.id == node_id):
-                spring.active = False
-                affected_springs.append(spring)
+        # Probeweise entfernen und exakt dieselben Federn wiederherstellen
+        live = structure.remove_node(node_id)
 
         connected = StructureValidator.is_connected(structure)
         load_paths_ok = StructureValidator.has_load_paths(structure) if connected else False
 
-        node.active = True
-        for spring in affected_springs:
-            spring.active = True
+        structure.restore_node(node_id, live)
 
         return connected and load_paths_ok
 
@@ -9,6 +9,30 @@ from model.structure import Structure
 
 
 
+def element_stiffness_matrices(
+    structure: Structure,
+    active: npt.NDArray[np.bool_] | npt.NDArray[np.intp],
+) -> npt.NDArray[np.float64]:
+    """Elementmatrizen der ausgewählten Federn inkl. Materialfaktor.
+
+    Parameters
+    ----------
+    structure : Structure
+        Die Struktur.
+    active : npt.NDArray[np.bool_] | npt.NDArray[np.intp]
+        Maske oder IDs der Federn, für die Matrizen berechnet werden.
+
+    Returns
+    -------
+    npt.NDArray[np.float64]
+        Array (N, 4, 4), Reihenfolge [ax, ay, bx, by] je Feder.
+    """
+    E_factor = structure.material.E / 210.0
+    Ko = structure.element_matrices()[active]
+    Ko *= E_factor
+    return Ko
+
+
 def assemble_global_K(structure: Structure) -> scipy.sparse.csr_matrix:
     """ Globale Steifigkeitsmatrix als Sparse-Matrix.
 
@@ -23,29 +47,20 @@ def assemble_global_K(structure: Structure) -> scipy.sparse.csr_matrix:
         Steifigkeitsmatrix K_g mit Größe (2*N, 2*N).
     """
     n_dof = len(structure.nodes) * 2
-    rows, cols, vals = [], [], []
-
-    for spring in structure.springs:
-        if not spring.active:
-            continue
+    active = structure.active_spring_indices()
 
-        i = spring.node_a.id
-        j = spring.node_b.id
-        dofs = [2 * i, 2 * i + 1, 2 * j, 2 * j + 1]
-
-        E_factor = structure.material.E / 210.0
-        Ko = spring.get_stiffness_matrix() * E_factor
-
-        for r, dr in enumerate(dofs):
-            for c, dc in enumerate(dofs):
-                rows.append(dr)
-                cols.append(dc)
-                vals.append(Ko[r, c])
-
-    if not rows:
+    if len(active) == 0:
         return scipy.sparse.csr_matrix((n_dof, n_dof))
 
-    return scipy.sparse.csr_matrix((vals, (rows, cols)), shape=(n_dof, n_dof))
+    Ko = element_stiffness_matrices(structure, active)
+
+    # Das Besetzungsmuster aller Federn wird einmal bestimmt und wiederverwendet;
+    # je Solve werden nur die 16 Einträge jeder aktiven Elementmatrix in ihre
+    # CSR-Positionen summiert (statt COO-Tripletts zu sortieren). Nicht mehr
+    # belegte Positionen entfernter Federn bleiben als explizite Nullen stehen.
+    indptr, indices, slot = structure.stiffness_pattern()
+    data = np.bincount(slot[active].ravel(), weights=Ko.ravel(), minlength=len(indices))
+    return scipy.sparse.csr_matrix((data, indices, indptr), shape=(n_dof, n_dof))
 
 
 def assemble_force_vector(structure: Structure) -> npt.NDArray[np.float64]:
@@ -64,9 +79,8 @@ def assemble_force_vector(structure: Structure) -> npt.NDArray[np.float64]:
     n_dof = len(structure.nodes) * 2
     F = np.zeros(n_dof)
 
-    for node in structure.nodes:
-        F[2 * node.id] = node.force_x
-        F[2 * node.id + 1] = -node.force_y
+    F[0::2] = structure.force_x
+    F[1::2] = -structure.force_y
 
     return F
 
@@ -84,24 +98,19 @@ def get_fixed_dofs(structure: Structure) -> list[int]:
     list[int]
         Indizes der fixierten DOFs.
     """
-    fixed = []
-    for node in structure.nodes:
-        if not node.active:
-            fixed.append(2 * node.id)
-            fixed.append(2 * node.id + 1)
-        else:
-            if node.fix_x:
-                fixed.append(2 * node.id)
-            if node.fix_y:
-                fixed.append(2 * node.id + 1)
-    return fixed
+    fixed = np.zeros(len(structure.nodes) * 2, dtype=bool)
+    inactive = ~structure.node_active
+    fixed[0::2] = inactive | (structure.fix_x != 0)
+    fixed[1::2] = inactive | (structure.fix_y != 0)
+    return np.flatnonzero(fixed).tolist()
 
 
 def solve(
     K: scipy.sparse.csr_matrix,
     F: npt.NDArray[np.float64],
-    u_fixed_idx: list[int],
+    u_fixed_idx: list[int] | None,
     residual_tol: float = 0.01,
+    free: npt.NDArray[np.intp] | None = None,
 ) -> npt.NDArray[np.float64] | None:
     """Löst K*u = F auf dem reduzierten System (freie DOFs).
 
@@ -117,10 +126,12 @@ def solve(
         Steifigkeitsmatrix (wird nicht verändert).
     F : npt.NDArray[np.float64]
         Kraftvektor.
-    u_fixed_idx : list[int]
-        Fixierte Freiheitsgrade (u=0).
+    u_fixed_idx : list[int] | None
+        Fixierte Freiheitsgrade (u=0). Wird ignoriert, wenn free gegeben ist.
     residual_tol : float, optional
         Maximales relatives Residuum ||Ku-F||/||F||.
+    free : npt.NDArray[np.intp] | None, optional
+        Bereits bekannte freie DOFs (z.B. Structure.free_dofs()).
 
     Returns
     -------
@@ -128,8 +139,10 @@ def solve(
         Verschiebungsvektor u, oder None bei Fehler.
     """
     n = F.shape[0]
-    fixed = np.array(sorted(set(u_fixed_idx)), dtype=int)
-    free = np.setdiff1d(np.arange(n), fixed)
+    if free is None:
+        free_mask = np.ones(n, dtype=bool)
+        free_mask[np.asarray(u_fixed_idx, dtype=int)] = False
+        free = np.flatnonzero(free_mask)
 
     if len(free) == 0:
         return np.zeros(n)
@@ -174,16 +187,15 @@ def solve_structure(structure: Structure) -> npt.NDArray[np.float64] | None:
     """
     K_g = assemble_global_K(structure)
     F = assemble_force_vector(structure)
-    fixed_dofs = get_fixed_dofs(structure)
+    free = structure.free_dofs()
 
-    assert len(fixed_dofs) > 0, "Keine Lager definiert — Struktur ist nicht gelagert."
+    assert len(free) < len(F), "Keine Lager definiert — Struktur ist nicht gelagert."
 
-    u = solve(K_g, F, fixed_dofs)
+    u = solve(K_g, F, None, free=free)
 
     if u is not None:
-        for node in structure.nodes:
-            node.u_x = float(u[2 * node.id])
-            node.u_y = float(u[2 * node.id + 1])
+        structure.u_x[:] = u[0::2]
+        structure.u_y[:] = u[1::2]
 
     return u
 
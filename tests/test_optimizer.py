@@ -0,0 +1,173 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from model.structure import Structure
+from solver.fem_solver import solve_structure
+from optimizer.topology_optimizer import TopologyOptimizer
+from optimizer.validators import StructureValidator
+
+
+def _create_cantilever(width: int = 6, height: int = 3) -> Structure:
+    """Kragarm: linker Rand eingespannt, Kraft rechts unten."""
+    s = Structure(width, height)
+    for y in range(height):
+        nid = y * width
+        s.nodes[nid].fix_x = 1
+        s.nodes[nid].fix_y = 1
+    s.nodes[width - 1].force_y = -1.0
+    return s
+
+
+class TestSpringQuantities(unittest.TestCase):
+    """Vergleicht die vektorisierten Federgrößen mit der Einzelberechnung."""
+
+    def setUp(self):
+        self.s = _create_cantilever()
+        self.s.remove_node(8)
+        self.u = solve_structure(self.s)
+        self.assertIsNotNone(self.u)
+
+    def _u_e(self, sp) -> np.ndarray:
+        i, j = sp.node_a.id, sp.node_b.id
+        return np.array([self.u[2 * i], self.u[2 * i + 1], self.u[2 * j], self.u[2 * j + 1]])
+
+    def test_energies_match_single(self):
+        energies = TopologyOptimizer.compute_spring_energies(self.s, self.u)
+        active_ids = [sp.id for sp in self.s.springs if sp.active]
+        self.assertEqual(sorted(energies), active_ids)
+        for sp in self.s.springs:
+            if not sp.active:
+                continue
+            u_e = self._u_e(sp)
+            expected = 0.5 * float(u_e @ sp.get_stiffness_matrix() @ u_e)
+            self.assertAlmostEqual(energies[sp.id], expected, places=12)
+
+    def test_stresses_match_single(self):
+        stresses = TopologyOptimizer.compute_spring_stresses(self.s, self.u)
+        for sp in self.s.springs:
+            if not sp.active:
+                self.assertNotIn(sp.id, stresses)
+                continue
+            u_e = self._u_e(sp)
+            eps = float(np.dot(sp.get_direction_vector(), u_e[2:] - u_e[:2])) / sp.get_length()
+            self.assertAlmostEqual(stresses[sp.id], abs(eps) * 100.0, places=12)
+
+    def test_node_energies_sum_half_spring_energies(self):
+        spring_e = TopologyOptimizer.compute_spring_energies(self.s, self.u)
+        node_e = TopologyOptimizer.compute_node_energies(self.s, self.u)
+        for node in self.s.nodes:
+            candidate = (node.active and not node.fix_x and not node.fix_y
+                         and node.force_x == 0 and node.force_y == 0)
+            if not candidate:
+                self.assertNotIn(node.id, node_e)
+                continue
+            expected = sum(e / 2.0 for sid, e in spring_e.items()
+                           if node.id in (self.s.springs[sid].node_a.id, self.s.springs[sid].node_b.id))
+            self.assertAlmostEqual(node_e[node.id], expected, places=12)
+
+
+class TestCandidateRanking(unittest.TestCase):
+    """Teilsortierung muss der vollständigen stabilen Sortierung entsprechen."""
+
+    def test_partial_matches_full_sort(self):
+        rng = np.random.default_rng(0)
+        ids = np.arange(0, 200, 2)
+        energies = rng.integers(0, 10, size=len(ids)).astype(float)
+        expected = ids[np.argsort(energies, kind="stable")].tolist()
+        for k in (1, 4, 37, 100, 500):
+            ranked = list(TopologyOptimizer._ranked_candidates(ids, energies, k))
+            self.assertEqual(ranked, expected, f"k={k}")
+
+
+class TestCleanupDangling(unittest.TestCase):
+    """Endknoten-Ketten werden vollständig abgebaut."""
+
+    def test_removes_chain_to_fixed_point(self):
+        s = _create_cantilever(6, 3)
+        # Mittlere Reihe entfernen: obere Reihe x=2..5 wird zur losen Kette
+        for nid in (7, 8, 9, 10, 11):
+            s.remove_node(nid)
+        removed = TopologyOptimizer._cleanup_dangling(s)
+        self.assertEqual(removed, 4)
+        for nid in (14, 15, 16, 17):
+            self.assertFalse(s.nodes[nid].active)
+        self.assertTrue(s.nodes[13].active)
+        degree = s.node_degrees()
+        leaves = s.node_active & s.removable_mask() & (degree <= 1)
+        self.assertFalse(leaves.any())
+
+
+class TestNearMinimumCount(unittest.TestCase):
+
+    def test_counts_within_tolerance(self):
+        energies = np.array([1.5, 1.0, 1.04, 2.0, 1.05])
+        self.assertEqual(TopologyOptimizer._near_minimum_count(energies, 0.05), 3)
+        self.assertEqual(TopologyOptimizer._near_minimum_count(energies, 0.0), 1)
+        self.assertEqual(TopologyOptimizer._near_minimum_count(np.array([]), 0.1), 0)
+
+
+class TestInteriorCheck(unittest.TestCase):
+    """Artikulations-Abkürzung muss can_remove_node exakt entsprechen."""
+
+    def test_matches_can_remove_node(self):
+        s = _create_cantilever(10, 5)
+        # Spalte x=5 bis auf Knoten 25 entfernen: 25 wird Artikulationspunkt
+        for nid in (5, 15, 35, 45, 12, 33):
+            s.remove_node(nid)
+        self.assertTrue(StructureValidator.is_connected(s))
+        mask = StructureValidator.articulation_points(s)
+        self.assertTrue(mask.any())
+        for nid in np.flatnonzero(s.node_active & s.removable_mask()).tolist():
+            self.assertEqual(
+                StructureValidator.can_remove_node(s, nid, mask),
+                StructureValidator.can_remove_node(s, nid),
+                f"Knoten {nid}",
+            )
+
+
+class TestStaleRemovals(unittest.TestCase):
+    """Zusätzliche Entfernungen ohne Solve sparen FEM-Lösungen."""
+
+    def test_fewer_solves_same_target(self):
+        histories = []
+        for tol in (0, 3):
+            s = _create_cantilever(16, 8)
+            histories.append(TopologyOptimizer.run(s, 0.6, stale_tolerance=tol))
+            self.assertLessEqual(s.active_node_count(), int(16 * 8 * 0.6))
+            self.assertIsNotNone(solve_structure(s))
+        self.assertLess(len(histories[1]), len(histories[0]))
+
+
+class TestHalvingFallback(unittest.TestCase):
+    """Parallele Versuche müssen dasselbe Ergebnis liefern wie sequentielle."""
+
+    def test_parallel_matches_sequential(self):
+        states = []
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            # Sequentiell, eigener Pool, gemeinsamer Pool über zwei Aufrufe
+            for workers, shared in ((1, None), (2, None), (2, pool), (2, pool)):
+                s = _create_cantilever(10, 5)
+                u = solve_structure(s)
+                removed = TopologyOptimizer._halving_fallback(
+                    s, u, 10, fast_mode=True, workers=workers, pool=shared,
+                )
+                self.assertGreater(removed, 0)
+                states.append((removed, s.node_active.copy(), s.u_y.copy()))
+        for other in states[1:]:
+            self.assertEqual(states[0][0], other[0])
+            np.testing.assert_array_equal(states[0][1], other[1])
+            np.testing.assert_array_equal(states[0][2], other[2])
+
+    def test_rejects_invalid_worker_count(self):
+        with self.assertRaises(ValueError):
+            TopologyOptimizer.run(_create_cantilever(), 0.5, fast_mode=True, fallback_workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
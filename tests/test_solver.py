@@ -6,6 +6,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from model.structure import Structure
+from model.spring import assemble_all_stiffness_matrices
 from solver.fem_solver import assemble_global_K, assemble_force_vector, get_fixed_dofs, solve_structure
 
 
@@ -56,6 +57,27 @@ class TestGlobalKAssembly(unittest.TestCase):
         # Gesamt = 6
         self.assertEqual(len(self.s.springs), 6)
 
+    def test_batch_matches_single(self):
+        # Vektorisierte Assemblierung muss dieselben Elementmatrizen liefern wie get_stiffness_matrix
+        s = Structure(3, 3)
+        Ko_all = assemble_all_stiffness_matrices(s.springs)
+        self.assertEqual(Ko_all.shape, (len(s.springs), 4, 4))
+        for spring, Ko in zip(s.springs, Ko_all):
+            self.assertTrue(np.allclose(Ko, spring.get_stiffness_matrix()),
+                            f"Abweichung bei Feder {spring.id}")
+
+    def test_matches_dense_after_removal(self):
+        # Wiederverwendetes Besetzungsmuster: nur aktive Federn tragen bei
+        s = Structure(4, 3)
+        s.remove_node(5)
+        K_ref = np.zeros((24, 24))
+        for sp in s.springs:
+            if sp.active:
+                i, j = sp.node_a.id, sp.node_b.id
+                dofs = [2 * i, 2 * i + 1, 2 * j, 2 * j + 1]
+                K_ref[np.ix_(dofs, dofs)] += sp.get_stiffness_matrix()
+        self.assertTrue(np.allclose(assemble_global_K(s).toarray(), K_ref))
+
 
 class TestSolveCantilever2x2(unittest.TestCase):
     """Testet den FEM-Solver mit einem 2x2 Kragarm."""
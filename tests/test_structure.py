@@ -0,0 +1,194 @@
+import unittest
+import numpy as np
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from model.structure import Structure
+from solver.fem_solver import get_fixed_dofs
+
+
+class TestStructureArrays(unittest.TestCase):
+    """Testet die SoA-Arrays und die daraus abgeleiteten Zähler der Struktur."""
+
+    def setUp(self):
+        self.s = Structure(4, 3)
+
+    def test_views_share_arrays(self):
+        # Knoten und Federn sind Sichten: Schreibzugriffe landen in den Arrays
+        self.s.nodes[5].fix_x = 1
+        self.s.nodes[5].force_y = -2.0
+        self.assertEqual(self.s.fix_x[5], 1)
+        self.assertAlmostEqual(self.s.force_y[5], -2.0)
+        self.s.springs[3].active = False
+        self.assertFalse(self.s.spring_active[3])
+
+    def test_remove_node_deactivates_incident_springs(self):
+        self.s.remove_node(5)
+        for sp in self.s.springs:
+            touches = sp.node_a.id == 5 or sp.node_b.id == 5
+            if touches:
+                self.assertFalse(sp.active, f"Feder {sp.id} sollte inaktiv sein")
+            else:
+                self.assertTrue(sp.active, f"Feder {sp.id} sollte aktiv bleiben")
+
+    def test_restore_node_skips_springs_to_removed_neighbors(self):
+        self.s.remove_node(5)
+        self.s.remove_node(6)
+        self.s.restore_node(5)
+        for sp in self.s.springs:
+            ends = (sp.node_a.id, sp.node_b.id)
+            self.assertEqual(sp.active, 6 not in ends, f"Feder {sp.id}")
+        degrees = [sum(1 for sp in self.s.springs if sp.active and n.id in (sp.node_a.id, sp.node_b.id))
+                   for n in self.s.nodes]
+        self.assertEqual(self.s.node_degrees().tolist(), degrees)
+
+    def test_counters_match_arrays(self):
+        # Nachbedingung: laufende Zähler entsprechen den Arrays nach jeder Änderung
+        self.s.active_spring_indices()  # Cache füllen, muss danach verworfen werden
+        self.s.remove_node(5)
+        self.s.remove_node(6)
+        self.s.nodes[6].active = True
+        self.s.restore_node(5)
+        self.s.springs[0].active = False
+        self.assertEqual(self.s.active_node_count(), int(np.count_nonzero(self.s.node_active)))
+        self.assertEqual(self.s.active_spring_count(), int(np.count_nonzero(self.s.spring_active)))
+        np.testing.assert_array_equal(self.s.active_spring_indices(),
+                                      np.flatnonzero(self.s.spring_active))
+        live = self.s.spring_active
+        degree = np.bincount(self.s.spring_a[live], minlength=len(self.s.nodes)) \
+            + np.bincount(self.s.spring_b[live], minlength=len(self.s.nodes))
+        np.testing.assert_array_equal(self.s.node_degrees(), degree)
+
+    def test_restore_active_state(self):
+        state = self.s.active_state()
+        self.s.remove_node(5)
+        self.s.remove_node(7)
+        free_before = self.s.free_dofs().tolist()
+        self.s.restore_active_state(state)
+        self.assertTrue(self.s.node_active.all())
+        self.assertTrue(self.s.spring_active.all())
+        self.assertEqual(self.s.active_node_count(), len(self.s.nodes))
+        self.assertEqual(self.s.active_spring_count(), len(self.s.springs))
+        self.assertGreater(len(self.s.free_dofs()), len(free_before))
+
+    def test_element_matrices_follow_k_changes(self):
+        K0 = self.s.element_matrices()
+        self.assertIs(self.s.element_matrices(), K0)
+        self.s.springs[2].k = 3.0
+        K1 = self.s.element_matrices()
+        np.testing.assert_allclose(K1[2], self.s.springs[2].get_stiffness_matrix())
+        self.assertFalse(np.allclose(K1[2], K0[2]))
+
+    def test_element_matrices_follow_moved_node(self):
+        from model.spring import stiffness_matrices
+
+        self.s.element_matrices()
+        self.s.nodes[1].y = 0.5
+        a, b = self.s.spring_a, self.s.spring_b
+        general = stiffness_matrices(self.s.node_x[a], self.s.node_y[a],
+                                     self.s.node_x[b], self.s.node_y[b], self.s.spring_k)
+        np.testing.assert_allclose(self.s.element_matrices(), general, rtol=0, atol=1e-15)
+        np.testing.assert_allclose(self.s.element_matrices()[0][0], [0.8, 0.4, -0.8, -0.4])
+        e, _ = self.s.spring_axes()
+        np.testing.assert_allclose(e[0], np.array([2.0, 1.0]) / np.sqrt(5.0))
+
+        # Eigenständige Feder über die Referenzmatrix-Abkürzung
+        from model.node import Node
+        from model.spring import Spring
+        n0, n1 = Node(0, 0.0, 0.0), Node(1, 1.0, 0.0)
+        sp = Spring(0, n0, n1)
+        sp.get_stiffness_matrix()
+        n1.y = 0.5
+        np.testing.assert_allclose(sp.get_stiffness_matrix(), general[0], rtol=0, atol=1e-15)
+
+    def test_orientation_follows_coordinates(self):
+        from model.node import Node
+        from model.spring import Spring, ORIENT_H, ORIENT_V, ORIENT_DIAG, ORIENT_ANTIDIAG, ORIENT_OTHER
+
+        grid = self.s.spring_orientation.copy()
+        k_grid = self.s.spring_stiffness().copy()
+        self.s.nodes[1].y = 0.5
+        # Federn 0, 3, 4, 6 liegen nicht mehr im Gitter, Feder 5 bleibt vertikal
+        self.assertEqual(self.s.spring_orientation[[0, 3, 4, 5, 6]].tolist(),
+                         [ORIENT_OTHER, ORIENT_OTHER, ORIENT_OTHER, ORIENT_V, ORIENT_OTHER])
+        self.assertEqual(self.s.spring_stiffness()[3], 1.0)
+        self.s.nodes[1].y = 0.0
+        np.testing.assert_array_equal(self.s.spring_orientation, grid)
+        np.testing.assert_array_equal(self.s.spring_stiffness(), k_grid)
+
+        # Eigenständige Feder: Klassifikation folgt der aktuellen Knotenlage
+        a, b = Node(0, 0.0, 0.0), Node(1, 1.0, 0.0)
+        sp = Spring(0, a, b)
+        self.assertEqual(sp.orientation, ORIENT_H)
+        b.y = 1.0
+        self.assertEqual(sp.orientation, ORIENT_DIAG)
+        self.assertAlmostEqual(sp.get_stiffness(), 1.0 / np.sqrt(2.0))
+        b.x, b.y = -1.0, 1.0
+        self.assertEqual(sp.orientation, ORIENT_ANTIDIAG)
+
+    def test_free_dofs_follow_bc_changes(self):
+        # Der Cache muss nach Lageränderungen und remove_node neu berechnet werden
+        def expected():
+            return sorted(set(range(2 * len(self.s.nodes))) - set(get_fixed_dofs(self.s)))
+
+        self.assertEqual(self.s.free_dofs().tolist(), expected())
+        self.s.nodes[0].fix_x = 1
+        self.s.nodes[3].fix_y = 1
+        self.assertEqual(self.s.free_dofs().tolist(), expected())
+        self.s.remove_node(5)
+        self.assertEqual(self.s.free_dofs().tolist(), expected())
+        self.s.nodes[5].active = True
+        self.assertEqual(self.s.free_dofs().tolist(), expected())
+
+    def test_removable_mask_follows_bc_changes(self):
+        self.assertTrue(self.s.removable_mask().all())
+        self.s.nodes[2].force_y = -1.0
+        self.s.nodes[4].fix_x = 1
+        expected = np.ones(len(self.s.nodes), dtype=bool)
+        expected[[2, 4]] = False
+        np.testing.assert_array_equal(self.s.removable_mask(), expected)
+        self.s.nodes[2].force_y = 0.0
+        self.assertTrue(self.s.removable_mask()[2])
+
+    def test_find_node(self):
+        self.assertIs(self.s.find_node(5), self.s.nodes[5])
+        self.assertIsNone(self.s.find_node(None))
+        self.assertIsNone(self.s.find_node(-1))
+        self.assertIsNone(self.s.find_node(len(self.s.nodes)))
+
+    def test_node_mirror(self):
+        w = self.s.width
+        for node in self.s.nodes:
+            x, y = node.id % w, node.id // w
+            self.assertEqual(self.s.node_mirror[node.id], y * w + (w - 1 - x))
+
+    def test_pickle_keeps_arrays_only(self):
+        import pickle
+
+        self.s.nodes[0].fix_x = 1
+        self.s.remove_node(5)
+        self.s.element_matrices()
+        clone = pickle.loads(pickle.dumps(self.s))
+        for name, arr in self.s.arrays().items():
+            np.testing.assert_array_equal(clone.arrays()[name], arr, err_msg=name)
+        self.assertIsNone(clone._element_matrices)
+        self.assertEqual(clone.active_node_count(), self.s.active_node_count())
+        np.testing.assert_array_equal(clone.node_degrees(), self.s.node_degrees())
+        self.assertIs(clone.springs[3].node_a, clone.nodes[clone.springs[3].node_a.id])
+        clone.remove_node(6)
+        self.assertTrue(self.s.nodes[6].active)
+
+    def test_same_shape_does_not_share_state(self):
+        other = Structure(self.s.width, self.s.height)
+        np.testing.assert_array_equal(other.spring_a, self.s.spring_a)
+        self.s.nodes[1].x = 7.0
+        self.s.remove_node(5)
+        self.assertEqual(other.nodes[1].x, 1.0)
+        self.assertTrue(other.nodes[5].active)
+        self.assertEqual(other.node_degrees()[5], 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
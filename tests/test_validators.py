@@ -0,0 +1,108 @@
+import unittest
+import numpy as np
+import networkx as nx
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from model.structure import Structure
+from optimizer.validators import StructureValidator
+
+
+def _graph(s: Structure) -> nx.Graph:
+    G = nx.Graph()
+    G.add_nodes_from(n.id for n in s.nodes if n.active)
+    G.add_edges_from((sp.node_a.id, sp.node_b.id) for sp in s.springs if sp.active)
+    return G
+
+
+class TestArticulationPoints(unittest.TestCase):
+    """Vergleicht die Artikulationspunkte mit networkx."""
+
+    def test_full_grid_has_none(self):
+        s = Structure(5, 4)
+        self.assertFalse(StructureValidator.articulation_points(s).any())
+
+    def test_matches_networkx_after_removals(self):
+        rng = np.random.default_rng(1)
+        for _ in range(5):
+            s = Structure(8, 5)
+            for nid in rng.choice(len(s.nodes), size=18, replace=False):
+                s.remove_node(int(nid))
+            mask = StructureValidator.articulation_points(s)
+            expected = set(nx.articulation_points(_graph(s)))
+            self.assertEqual(set(np.flatnonzero(mask).tolist()), expected)
+
+
+class TestConnectivity(unittest.TestCase):
+    """Vergleicht is_connected mit networkx."""
+
+    def test_matches_networkx(self):
+        rng = np.random.default_rng(2)
+        for size in (4, 12, 20):
+            s = Structure(6, 5)
+            for nid in rng.choice(len(s.nodes), size=size, replace=False):
+                s.remove_node(int(nid))
+            self.assertEqual(StructureValidator.is_connected(s), nx.is_connected(_graph(s)))
+
+    def test_split_structure(self):
+        s = Structure(5, 3)
+        for nid in (2, 7, 12):
+            s.remove_node(nid)
+        self.assertFalse(StructureValidator.is_connected(s))
+
+
+class TestLoadPaths(unittest.TestCase):
+    """Vergleicht has_load_paths mit paarweisen networkx-Pfaden."""
+
+    @staticmethod
+    def _expected(s: Structure) -> bool:
+        G = _graph(s)
+        supports = [n.id for n in s.nodes if n.active and (n.fix_x or n.fix_y)]
+        if not supports:
+            return False
+        return all(
+            any(nx.has_path(G, n.id, sup) for sup in supports)
+            for n in s.nodes if n.active and (n.force_x != 0 or n.force_y != 0)
+        )
+
+    def test_matches_networkx(self):
+        rng = np.random.default_rng(3)
+        for size in (0, 6, 12, 18):
+            s = Structure(6, 5)
+            s.nodes[0].fix_x = s.nodes[0].fix_y = 1
+            s.nodes[24].fix_y = 1
+            s.nodes[5].force_y = -1.0
+            s.nodes[29].force_x = 1.0
+            free = [i for i in range(len(s.nodes)) if i not in (0, 24, 5, 29)]
+            for nid in rng.choice(free, size=size, replace=False):
+                s.remove_node(int(nid))
+            self.assertEqual(StructureValidator.has_load_paths(s), self._expected(s))
+
+    def test_without_supports(self):
+        s = Structure(3, 3)
+        s.nodes[2].force_y = -1.0
+        self.assertFalse(StructureValidator.has_load_paths(s))
+
+
+class TestCanRemoveNode(unittest.TestCase):
+
+    def test_trial_removal_restores_exact_state(self):
+        s = Structure(5, 4)
+        s.nodes[0].fix_x = s.nodes[0].fix_y = 1
+        s.nodes[4].force_y = -1.0
+        # Einzeln deaktivierte Feder am Kandidaten darf nicht wiederbelebt werden
+        sid = int(s.incident_springs(7)[0])
+        s.springs[sid].active = False
+        before = s.active_state()
+        degrees = s.node_degrees().copy()
+        StructureValidator.can_remove_node(s, 7)
+        np.testing.assert_array_equal(s.node_active, before[0])
+        np.testing.assert_array_equal(s.spring_active, before[1])
+        np.testing.assert_array_equal(s.node_degrees(), degrees)
+        self.assertEqual(s.active_spring_count(), int(before[1].sum()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,12 +21,14 @@ _DEFAULT_MATERIAL_NAMES = {m.name for m in Material.defaults()}
 
 def _has_forces(structure: Structure) -> bool:
     """Prüft ob aktive Knoten mit Kräften vorhanden sind."""
-    return any(n.force_x != 0 or n.force_y != 0 for n in structure.nodes if n.active)
+    loaded = (structure.force_x != 0) | (structure.force_y != 0)
+    return bool((loaded & structure.node_active).any())
 
 
 def _has_bcs(structure: Structure) -> bool:
     """Prüft ob aktive Knoten mit Lagern vorhanden sind."""
-    return any(n.fix_x or n.fix_y for n in structure.nodes if n.active)
+    fixed = (structure.fix_x != 0) | (structure.fix_y != 0)
+    return bool((fixed & structure.node_active).any())
 
 
 def _apply_default_bcs(structure: Structure) -> None:
@@ -67,9 +69,7 @@ def _tab_struktur(s: Structure, mass_fraction: float,
             if nid is not None:
                 st.session_state.selected_node_id = int(nid)
 
-        selected_node = next(
-            (n for n in s.nodes if n.id == st.session_state.selected_node_id), None
-        )
+        selected_node = s.find_node(st.session_state.selected_node_id)
         if st.session_state.selected_node_id is not None:
             if st.button("Auswahl aufheben", key="deselect"):
                 st.session_state.selected_node_id = None
@@ -245,11 +245,8 @@ def _tab_struktur(s: Structure, mass_fraction: float,
                 n_total = len(s.nodes)
                 reduction = (1 - n_active / n_total) * 100
 
-                displacements = [
-                    np.sqrt(u[2 * n.id] ** 2 + u[2 * n.id + 1] ** 2)
-                    for n in s.nodes if n.active
-                ]
-                max_disp = max(displacements) if displacements else 0.0
+                uxy = u.reshape(-1, 2)[s.node_active]
+                max_disp = float(np.hypot(uxy[:, 0], uxy[:, 1]).max()) if len(uxy) else 0.0
 
                 compliance = float(np.dot(u, u))
 
@@ -269,10 +266,11 @@ def _tab_struktur(s: Structure, mass_fraction: float,
 
 def _structure_key(s: Structure) -> tuple:
     """Schlüssel zur Erkennung von Änderungen der Basisstruktur."""
+    act = s.node_active
     return (
         s.width, s.height, s.material.name, s.active_node_count(),
-        round(sum(n.force_x + n.force_y for n in s.nodes if n.active), 4),
-        sum(n.fix_x + n.fix_y for n in s.nodes if n.active),
+        round(float((s.force_x[act] + s.force_y[act]).sum()), 4),
+        int(s.fix_x[act].sum()) + int(s.fix_y[act].sum()),
     )
 
 
@@ -519,7 +517,7 @@ def main():
     if "last_uploaded" not in st.session_state:
         st.session_state.last_uploaded = None
     if "materials" not in st.session_state:
-        st.session_state.materials = Material.defaults()
+        st.session_state.materials = list(Material.defaults())
     if "gif_bytes" not in st.session_state:
         st.session_state.gif_bytes = None
     if "gif_checkpoints" not in st.session_state:
@@ -206,7 +206,7 @@ def plot_structure(
         ))
 
     if highlight_node_id is not None:
-        node = next((nd for nd in structure.nodes if nd.id == highlight_node_id), None)
+        node = structure.find_node(highlight_node_id)
         if node:
             fig.add_trace(go.Scatter(
                 x=[_px(node)], y=[_py(node)], mode="markers",